@@ -21,18 +21,61 @@ Output location: /tmp/dimensions-results/ (default), or specify with --output-di
 import sys
 import json
 import argparse
+import functools
+import importlib
 import os
+import re
+import threading
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import time
 
-import dimcli
-import pandas as pd
+
+
+class _LazyModule:
+    """
+    Stand-in for a heavy module that imports it on first attribute access and then
+    replaces itself in this module's globals, so --help and argument errors stay fast.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+# dimcli is imported by _get_client; these load when first used
+np = _LazyModule('numpy', 'np')
+pd = _LazyModule('pandas', 'pd')
+pa = _LazyModule('pyarrow', 'pa')
+pq = _LazyModule('pyarrow.parquet', 'pq')
+
+try:
+    import orjson  # Optional: much faster JSON encoding for JSONL/text output
+except ImportError:
+    orjson = None
+
+# orjson options matching json.dumps(default=str) behaviour for API payloads
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+# Stdlib fallback: one compact encoder reused for every record (API payloads are never circular)
+_json_encode = json.JSONEncoder(default=str, ensure_ascii=False, check_circular=False,
+                                separators=(',', ':')).encode
 
 # ============================================================================
 # OUTPUT MODE MANAGEMENT
 # ============================================================================
 
+def _noop(*args, **kwargs):
+    """Stand-in for OutputMode methods that do nothing in silent mode."""
+
+
 class OutputMode:
     """Manages output verbosity and workflow tracking."""
 
@@ -50,6 +93,10 @@ class OutputMode:
         self.command = None
         self.args_summary = {}
         self.output_files = []
+        self._lock = threading.Lock()
+        if mode == self.SILENT:
+            # Steps and log lines are verbose-only; bind no-ops instead of branching per call
+            self.step = self.step_done = self.log = _noop
 
     def start(self, command, args_summary):
         """Start tracking a workflow."""
@@ -76,22 +123,16 @@ class OutputMode:
         print("─" * 60, file=sys.stderr)
 
     def step(self, step_num, total_steps, description, status="running"):
-        """Log a workflow step."""
-        self.steps.append({
-            'step': step_num,
-            'total': total_steps,
-            'description': description,
-            'status': status,
-            'time': datetime.now().isoformat()
-        })
+        """Log a workflow step (verbose mode only)."""
+        # (step, total, description, status, timestamp)
+        self.steps.append((step_num, total_steps, description, status, time.time()))
 
-        if self.mode == self.VERBOSE:
-            if status == "running":
-                print(f"  [{step_num}/{total_steps}] {description}...", file=sys.stderr)
-            elif status == "done":
-                print(f"  [{step_num}/{total_steps}] {description} ✓", file=sys.stderr)
-            elif status == "error":
-                print(f"  [{step_num}/{total_steps}] {description} ✗", file=sys.stderr)
+        if status == "running":
+            print(f"  [{step_num}/{total_steps}] {description}...", file=sys.stderr)
+        elif status == "done":
+            print(f"  [{step_num}/{total_steps}] {description} ✓", file=sys.stderr)
+        elif status == "error":
+            print(f"  [{step_num}/{total_steps}] {description} ✗", file=sys.stderr)
 
     def step_done(self, step_num, total_steps, description):
         """Mark a step as done."""
@@ -99,13 +140,13 @@ class OutputMode:
 
     def log(self, message):
         """Log a message in verbose mode."""
-        if self.mode == self.VERBOSE:
-            print(f"       → {message}", file=sys.stderr)
+        print(f"       → {message}", file=sys.stderr)
 
     def api_call(self, page, total_pages, records, duration):
         """Log an API call."""
-        self.api_calls += 1
-        self.records_retrieved += records
+        with self._lock:
+            self.api_calls += 1
+            self.records_retrieved += records
 
         if self.mode == self.VERBOSE:
             print(f"       API call {page}/{total_pages}: {records} records ({duration:.2f}s)", file=sys.stderr)
@@ -124,13 +165,14 @@ class OutputMode:
             print(f"    {dsl_query}", file=sys.stderr)
             print("", file=sys.stderr)
 
-    def add_output_file(self, filepath, format_type, rows=None, size_bytes=None):
+    def add_output_file(self, filepath, format_type, rows=None, size_bytes=None, columns=None):
         """Record an output file."""
         self.output_files.append({
             'path': str(filepath),
             'format': format_type,
             'rows': rows,
-            'size_bytes': size_bytes
+            'size_bytes': size_bytes,
+            'columns': columns
         })
 
     def confirm(self, estimated_calls=1, estimated_records=None):
@@ -185,9 +227,13 @@ class OutputMode:
         if self.output_files:
             print("─" * 60, file=sys.stderr)
             print("  To load data:", file=sys.stderr)
-            parquet_file = next((f['path'] for f in self.output_files if f['format'] == 'parquet'), None)
-            if parquet_file:
-                print(f"    df = pd.read_parquet('{parquet_file}')", file=sys.stderr)
+            parquet = next((f for f in self.output_files if f['format'] == 'parquet'), None)
+            if parquet:
+                print(f"    df = pd.read_parquet('{parquet['path']}', engine='pyarrow')", file=sys.stderr)
+                if parquet.get('columns') and len(parquet['columns']) > 5:
+                    # Wide tables: parquet is columnar, so loading a subset is much cheaper
+                    print(f"    # or only the columns you need, e.g. columns={parquet['columns'][:5]!r}",
+                          file=sys.stderr)
 
         print("═" * 60 + "\n", file=sys.stderr)
 
@@ -207,105 +253,205 @@ def _get_client():
     """Lazy-initialize and return the dimcli client."""
     global _client
     if _client is None:
+        import dimcli
         dimcli.login()
         _client = dimcli.Dsl()
     return _client
 
-# Cache for valid fields (fetched dynamically from API)
-_valid_fields_cache = {
-    'facets': {},     # source -> set of valid facet fields
-    'filters': {},    # source -> set of valid filter fields
-    'metrics': {},    # source -> set of valid metrics
-}
+
+# Number of distinct DSL query results memoized per process
+QUERY_CACHE_SIZE = 256
+
+
+# A single-call query result: the decoded payload, the total match count, and whether it came from the cache
+QueryResult = namedtuple('QueryResult', ['json', 'count_total', 'cached'])
+
+# DSL string -> (serialized payload, count_total), least recently used first
+_query_cache = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+def _cached_query(dsl):
+    """
+    Run a DSL query, memoizing the result by its exact DSL string.
+    The cache holds the payload serialized, so every call gets its own freshly decoded
+    copy that callers may modify. Results that report errors are not cached (dimcli
+    reports many query errors in the payload rather than raising), so a retry hits the
+    API again. Used for single-call queries; paginated queries always hit the API.
+    """
+    with _query_cache_lock:
+        entry = _query_cache.get(dsl)
+        if entry is not None:
+            _query_cache.move_to_end(dsl)
+    if entry is not None:
+        payload, count_total = entry
+        return QueryResult(orjson.loads(payload) if orjson is not None else json.loads(payload), count_total, True)
+
+    result = _get_client().query(dsl)
+    data = result.json
+    if not data.get('errors'):
+        payload = orjson.dumps(data, option=_ORJSON_OPTIONS) if orjson is not None else json.dumps(data)
+        with _query_cache_lock:
+            _query_cache[dsl] = (payload, result.count_total)
+            if len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+    return QueryResult(data, result.count_total, False)
 
 
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
 
-def _fetch_source_metadata(source):
-    """Fetch metadata about a source from the API using describe."""
-    if source in _valid_fields_cache['facets']:
-        return  # Already cached
+# On-disk schema cache (set DIMENSIONS_SCHEMA_TTL=0 to disable)
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "dimensions"
+SCHEMA_CACHE_TTL = int(os.environ.get('DIMENSIONS_SCHEMA_TTL', 86400))  # seconds
+
+
+def _load_cached_schema(name):
+    """Return a cached schema payload (e.g. 'schema_publications') if it is within the TTL."""
+    if SCHEMA_CACHE_TTL <= 0:
+        return None
+    path = SCHEMA_CACHE_DIR / f"{name}.json"
+    try:
+        if time.time() - path.stat().st_mtime > SCHEMA_CACHE_TTL:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
 
+def _save_cached_schema(name, payload):
+    """Persist a schema payload under the cache directory (best effort)."""
+    if SCHEMA_CACHE_TTL <= 0:
+        return
     try:
+        SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(SCHEMA_CACHE_DIR / f"{name}.json", 'w') as f:
+            json.dump(payload, f)
+    except OSError:
+        pass
+
+
+# Valid fields for a source; facet_prefixes maps a facet's first '_' segment to facet names
+SourceSchema = namedtuple('SourceSchema', ['facets', 'filters', 'metrics', 'facet_prefixes'])
+
+
+def _build_schema(facets, filters, metrics):
+    """Freeze parsed field sets into a SourceSchema with a facet prefix index."""
+    facet_prefixes = defaultdict(list)
+    for name in sorted(facets):
+        facet_prefixes[name.split('_')[0]].append(name)
+    return SourceSchema(frozenset(facets), frozenset(filters), frozenset(metrics),
+                        {prefix: tuple(names) for prefix, names in facet_prefixes.items()})
+
+
+@functools.lru_cache(maxsize=16)
+def _source_schema(source):
+    """
+    Return the SourceSchema of valid fields for a source.
+    Cached per process and on disk; raises on API errors so failures are not cached.
+    """
+    cached = _load_cached_schema(f"schema_{source}")
+    if cached:
+        output.log(f"Schema for '{source}' loaded from cache")
+        return _build_schema(cached.get('facets', []), cached.get('filters', []),
+                             cached.get('metrics', []))
+
+    # A cached 'describe' payload holds the same fields and metrics, so reuse it before the API
+    described = _load_cached_schema(f"describe_{source}")
+    if described:
+        output.log(f"Schema for '{source}' derived from cached describe output")
+        fields_data = described.get('fields', {})
+        metrics_data = described.get('metrics', [])
+    else:
         output.log(f"Fetching schema for '{source}'...")
         dsl = f'describe source {source}'
-        result = _get_client().query(dsl)
+        result = _cached_query(dsl)
         fields_data = result.json.get('fields', {})
         metrics_data = result.json.get('metrics', [])
 
-        facets = set()
-        filters = set()
-        metrics = set()
-
-        # Extract facet and filter fields
-        for field_name, field_info in fields_data.items():
-            if isinstance(field_info, dict):
-                if field_info.get('is_facet'):
-                    facets.add(field_name)
-                if field_info.get('is_filter'):
-                    filters.add(field_name)
-
-        # Extract valid metrics
-        for metric in metrics_data:
-            if isinstance(metric, dict):
-                metric_name = metric.get('name')
-                if metric_name:
-                    metrics.add(metric_name)
-            elif isinstance(metric, str):
-                metrics.add(metric)
-
-        _valid_fields_cache['facets'][source] = facets
-        _valid_fields_cache['filters'][source] = filters
-        _valid_fields_cache['metrics'][source] = metrics
-
-        output.log(f"Schema loaded: {len(facets)} facets, {len(filters)} filters, {len(metrics)} metrics")
+    facets = set()
+    filters = set()
+    metrics = set()
+
+    # Extract facet and filter fields
+    for field_name, field_info in fields_data.items():
+        if isinstance(field_info, dict):
+            if field_info.get('is_facet'):
+                facets.add(field_name)
+            if field_info.get('is_filter'):
+                filters.add(field_name)
+
+    # Extract valid metrics
+    for metric in metrics_data:
+        if isinstance(metric, dict):
+            metric_name = metric.get('name')
+            if metric_name:
+                metrics.add(metric_name)
+        elif isinstance(metric, str):
+            metrics.add(metric)
+
+    if facets:
+        _save_cached_schema(f"schema_{source}", {'facets': sorted(facets), 'filters': sorted(filters),
+                                                 'metrics': sorted(metrics)})
+
+    output.log(f"Schema loaded: {len(facets)} facets, {len(filters)} filters, {len(metrics)} metrics")
+    return _build_schema(facets, filters, metrics)
+
+
+@functools.lru_cache(maxsize=512)
+def _facet_error(source, facet):
+    """
+    Return the error message for an invalid facet, or None if it is valid (or unknown).
+    Raises if the schema cannot be fetched, so failures are not cached.
+    """
+    schema = _source_schema(source)
+    valid_facets = schema.facets
 
-    except Exception as e:
-        output.warn(f"Could not fetch metadata for {source}: {e}")
+    if not valid_facets or facet in valid_facets:
+        return None
+
+    # Find similar fields for suggestions
+    suggestions = schema.facet_prefixes.get(facet.split('_')[0], ())[:5]
+
+    error_msg = f"Invalid facet '{facet}' for {source}.\n"
+    if suggestions:
+        error_msg += f"Similar valid facets: {', '.join(suggestions)}\n"
+    error_msg += f"Valid facets: {', '.join(sorted(valid_facets)[:15])}...\n"
+    error_msg += f"Use 'describe {source}' to see all available facets."
+    return error_msg
 
 
 def validate_facet(source, facet):
     """
     Validate that the facet field is valid for the source.
-    Fetches valid facets dynamically from the API.
+    Fetches valid facets dynamically from the API; results are memoized per (source, facet).
     """
-    _fetch_source_metadata(source)
-    valid_facets = _valid_fields_cache['facets'].get(source, set())
-
-    if not valid_facets:
+    try:
+        error_msg = _facet_error(source, facet)
+    except Exception as e:
         # If we couldn't fetch valid facets, let the API handle validation
+        output.warn(f"Could not fetch metadata for {source}: {e}")
         return
 
-    if facet not in valid_facets:
-        # Find similar fields for suggestions
-        suggestions = [f for f in valid_facets if facet.split('_')[0] in f][:5]
-
-        error_msg = f"Invalid facet '{facet}' for {source}.\n"
-        if suggestions:
-            error_msg += f"Similar valid facets: {', '.join(suggestions)}\n"
-        error_msg += f"Valid facets: {', '.join(sorted(valid_facets)[:15])}...\n"
-        error_msg += f"Use 'describe {source}' to see all available facets."
+    if error_msg:
         raise ValueError(error_msg)
 
     output.log(f"Facet '{facet}' validated ✓")
 
 
-def validate_aggregation_metrics(source, metrics_str):
+@functools.lru_cache(maxsize=512)
+def _metrics_error(source, metrics_str):
     """
-    Validate that aggregation metrics are valid for the source.
-    Fetches valid metrics dynamically from the API.
+    Return the error message for invalid aggregation metrics, or None if all are valid.
+    Raises if the schema cannot be fetched, so failures are not cached.
     """
-    if not metrics_str:
-        return
-
-    _fetch_source_metadata(source)
-    valid_metrics = _valid_fields_cache['metrics'].get(source, set())
+    valid_metrics = _source_schema(source).metrics
 
     if not valid_metrics:
         # If we couldn't fetch valid metrics, let the API handle validation
-        return
+        return None
 
     # Parse metrics (handle function syntax like sum(funding))
     metrics = [m.strip() for m in metrics_str.split(',')]
@@ -324,10 +470,31 @@ def validate_aggregation_metrics(source, metrics_str):
             if metric not in valid_metrics and metric != 'count':
                 invalid_metrics.append(metric)
 
-    if invalid_metrics:
-        error_msg = f"Invalid metric(s) for {source}: {', '.join(invalid_metrics)}\n"
-        error_msg += f"Valid metrics: {', '.join(sorted(valid_metrics))}\n"
-        error_msg += f"Use 'describe {source}' to see all available metrics."
+    if not invalid_metrics:
+        return None
+
+    error_msg = f"Invalid metric(s) for {source}: {', '.join(invalid_metrics)}\n"
+    error_msg += f"Valid metrics: {', '.join(sorted(valid_metrics))}\n"
+    error_msg += f"Use 'describe {source}' to see all available metrics."
+    return error_msg
+
+
+def validate_aggregation_metrics(source, metrics_str):
+    """
+    Validate that aggregation metrics are valid for the source.
+    Fetches valid metrics dynamically from the API; results are memoized per (source, metrics).
+    """
+    if not metrics_str:
+        return
+
+    try:
+        error_msg = _metrics_error(source, metrics_str)
+    except Exception as e:
+        # If we couldn't fetch valid metrics, let the API handle validation
+        output.warn(f"Could not fetch metadata for {source}: {e}")
+        return
+
+    if error_msg:
         raise ValueError(error_msg)
 
     output.log(f"Metrics validated ✓")
@@ -339,108 +506,265 @@ def validate_aggregation_metrics(source, metrics_str):
 
 # Default output directory (use /tmp for stability)
 OUTPUT_DIR = Path("/tmp/dimensions-results")
-OUTPUT_DIR.mkdir(exist_ok=True)
+
+# Output directories already created by this process
+_DIR_READY = set()
+
+
+def _output_dir():
+    """Return OUTPUT_DIR, creating it the first time this process writes there."""
+    if OUTPUT_DIR not in _DIR_READY:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        _DIR_READY.add(OUTPUT_DIR)
+    return OUTPUT_DIR
 
 # Default format: dual (parquet + jsonl)
 DEFAULT_FORMAT = 'dual'
 
+# Output formats accepted by --format (a tuple keeps the order argparse shows in help and errors)
+FORMAT_CHOICES = ('dual', 'parquet', 'jsonl', 'tsv', 'csv')
+
+
+class _FilenameCharMap(dict):
+    """str.translate table mapping every non-alphanumeric character to '_' (filled lazily)."""
+
+    def __missing__(self, codepoint):
+        self[codepoint] = codepoint if chr(codepoint).isalnum() else '_'
+        return self[codepoint]
+
+
+_FILENAME_CHAR_MAP = _FilenameCharMap({c: c if chr(c).isalnum() else '_' for c in range(256)})
+
 
 def generate_filename(prefix, query_terms=None):
     """Generate a timestamped filename for output."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if query_terms:
         # Clean query terms for filename
-        clean_terms = "".join(c if c.isalnum() else "_" for c in query_terms[:30])
+        clean_terms = query_terms[:30].translate(_FILENAME_CHAR_MAP)
         return f"{prefix}_{clean_terms}_{timestamp}"
     return f"{prefix}_{timestamp}"
 
 
 def clean_nested_for_parquet(obj):
     """
-    Recursively clean nested structures for parquet compatibility.
+    Clean nested structures for parquet compatibility (empty strings become None).
+    Walks the structure with an explicit stack instead of recursing per node.
     """
-    if obj is None:
-        return None
-    elif isinstance(obj, str):
-        return None if obj == '' else obj
-    elif isinstance(obj, dict):
-        return {k: clean_nested_for_parquet(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [clean_nested_for_parquet(item) for item in obj]
-    else:
-        return obj
+    root = [None]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, node = stack.pop()
+        if isinstance(node, dict):
+            new = dict.fromkeys(node)  # Preserve key order
+            items = node.items()
+        elif isinstance(node, list):
+            new = [None] * len(node)
+            items = enumerate(node)
+        else:
+            parent[key] = None if isinstance(node, str) and node == '' else node
+            continue
+
+        parent[key] = new
+        for k, v in items:
+            if isinstance(v, (dict, list)):
+                stack.append((new, k, v))
+            elif not (isinstance(v, str) and v == ''):
+                new[k] = v
+    return root[0]
+
+
+# Value kinds used when classifying object columns for parquet export
+_KIND_EMPTY = 0  # empty string, empty list or empty dict
+_KIND_LIST = 1
+_KIND_DICT = 2
+_KIND_PRIMITIVE = 3
 
 
-def clean_for_parquet(df):
+def _value_kind(val):
+    """Classify a single cell value into one of the _KIND_* codes."""
+    if isinstance(val, list):
+        return _KIND_LIST if val else _KIND_EMPTY
+    if isinstance(val, dict):
+        return _KIND_DICT if val else _KIND_EMPTY
+    if isinstance(val, str) and val == '':
+        return _KIND_EMPTY
+    return _KIND_PRIMITIVE
+
+
+def _clean_column(series):
     """
-    Clean DataFrame for parquet export by ensuring consistent types per column.
+    Clean one object column so it holds a single kind of value (list, dict or primitive).
+    Returns a new object ndarray, or None if the column needs no cleaning.
     """
-    df_clean = df.copy()
+    arr = series.to_numpy(copy=False)
+    n = len(arr)
+    not_null = series.notna().to_numpy()
+    if not not_null.any():
+        return None
 
-    for col in df_clean.columns:
-        if df_clean[col].dtype != 'object':
-            continue  # Skip non-object columns (already typed)
+    # Classify every value in a single pass, then reuse the masks for writing
+    kinds = np.fromiter(map(_value_kind, arr), dtype=np.uint8, count=n)
+    is_list = kinds == _KIND_LIST
+    is_dict = kinds == _KIND_DICT
+    is_prim = (kinds == _KIND_PRIMITIVE) & not_null
+
+    # Find dominant type (only among actual values)
+    type_counts = {'list': int(is_list.sum()), 'dict': int(is_dict.sum()),
+                   'primitive': int(is_prim.sum())}
+    dominant_type = max(type_counts, key=type_counts.get)
+
+    # If no clear dominant, default to primitive
+    if type_counts[dominant_type] == 0:
+        dominant_type = 'primitive'
+
+    cleaned = np.full(n, None, dtype=object)
+    if dominant_type == 'primitive':
+        # Keep nulls as-is, drop nested values and empty strings
+        keep = is_prim | ~not_null
+        cleaned[keep] = arr[keep]
+    else:
+        keep = is_list if dominant_type == 'list' else is_dict
+        cleaned[keep] = np.fromiter((clean_nested_for_parquet(v) for v in arr[keep]),
+                                    dtype=object, count=type_counts[dominant_type])
+    return cleaned
+
+
+def _dumps(obj):
+    """Serialize a nested value to a JSON string (uses orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+    return _json_encode(obj)
 
-        # Sample non-null values to detect types (exclude empty strings)
-        non_null = df_clean[col].dropna()
-        if non_null.empty:
-            continue
 
-        # Count type occurrences (treat empty string as not a real value)
-        type_counts = {'list': 0, 'dict': 0, 'primitive': 0}
-        for val in non_null:
-            if isinstance(val, list) and val:  # Non-empty list
-                type_counts['list'] += 1
-            elif isinstance(val, dict) and val:  # Non-empty dict
-                type_counts['dict'] += 1
-            elif not isinstance(val, (list, dict)) and val != '':
-                type_counts['primitive'] += 1
-
-        # Find dominant type (only among actual values)
-        dominant_type = max(type_counts, key=type_counts.get)
-
-        # If no clear dominant, default to primitive
-        if type_counts[dominant_type] == 0:
-            dominant_type = 'primitive'
-
-        # Create cleaner function for this specific column
-        def make_cleaner(dominant):
-            def clean_value(val):
-                if val is None:
-                    return None
-                if dominant == 'list':
-                    if isinstance(val, list) and val:
-                        return clean_nested_for_parquet(val)
-                    return None
-                elif dominant == 'dict':
-                    if isinstance(val, dict) and val:
-                        return clean_nested_for_parquet(val)
-                    return None
-                else:  # primitive
-                    if isinstance(val, (list, dict)):
-                        return None
-                    if isinstance(val, str) and val == '':
-                        return None
-                    return val
-            return clean_value
-
-        cleaner = make_cleaner(dominant_type)
-        df_clean[col] = df_clean[col].apply(cleaner)
-
-    return df_clean
+def _dumps_indented(obj):
+    """Serialize a result for display with a 2-space indent (uses orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, default=str)
 
 
 def serialize_for_text_format(df):
     """
     Serialize nested structures to JSON strings for text formats (CSV, TSV).
     """
-    df_serialized = df.copy()
-    for col in df_serialized.columns:
-        if df_serialized[col].dtype == 'object':
-            df_serialized[col] = df_serialized[col].apply(
-                lambda x: json.dumps(x, default=str) if isinstance(x, (list, dict)) else x
-            )
-    return df_serialized
+    new_cols = {col: df[col] for col in df.columns}
+    for col in df.select_dtypes(include=['object']).columns:
+        arr = df[col].to_numpy(copy=False)
+        mask = np.fromiter((isinstance(v, (list, dict)) for v in arr),
+                           dtype=np.bool_, count=len(arr))
+        if not mask.any():
+            continue  # Only scalars: nothing to serialize
+
+        out = arr.copy()
+        out[mask] = np.fromiter(map(_dumps, arr[mask]), dtype=object, count=int(mask.sum()))
+        new_cols[col] = out
+    return pd.DataFrame(new_cols, index=df.index, copy=False)
+
+
+def _write_jsonl_records(f, records):
+    """Write records as JSON lines to an open binary file (uses orjson when available)."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        for record in records:
+            f.write(orjson.dumps(record, default=str, option=option))
+    else:
+        for record in records:
+            f.write(_json_encode(record).encode('utf-8'))
+            f.write(b'\n')
+
+
+def _write_jsonl(path, records):
+    """Write records to a JSON Lines file (uses orjson when available, else the stdlib encoder)."""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        _write_jsonl_records(f, records)
+
+
+def _column_values(col):
+    """A column's values as a list, with missing values (NaN, NaT, NA) as None so they are written as null."""
+    if col.hasnans:
+        return col.astype(object).where(col.notna(), None).tolist()
+    return col.tolist()
+
+
+def _iter_records(df):
+    """Yield DataFrame rows as plain dicts, reading each column's values only once."""
+    columns = [str(col) for col in df.columns]
+    values = [_column_values(df[col]) for col in df.columns]
+    for row in zip(*values):
+        yield dict(zip(columns, row))
+
+
+def _save_jsonl(path, df, raw_data=None):
+    """Save JSONL from raw data (preserves original nested structures), else from the DataFrame."""
+    _write_jsonl(path, raw_data if raw_data else _iter_records(df))
+
+
+@functools.cache
+def _arrow_errors():
+    """Arrow errors that mean a column could not be stored natively in parquet."""
+    return (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+# pyarrow.parquet.write_table options for all parquet output
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'use_dictionary': True,
+    'data_page_size': 1 << 20,
+}
+
+
+def _has_empty_struct(arrow_type):
+    """Check for struct types without fields (from empty dicts), which parquet cannot store."""
+    if pa.types.is_struct(arrow_type):
+        return arrow_type.num_fields == 0 or any(
+            _has_empty_struct(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_empty_struct(arrow_type.value_type)
+    return False
+
+
+def _to_arrow_table(df):
+    """
+    Convert a DataFrame to an Arrow table column by column.
+    Arrow infers each column's type itself; only columns it rejects are cleaned first.
+    """
+    object_cols = set(df.select_dtypes(include=['object']).columns)
+    arrays = []
+    for col in df.columns:
+        try:
+            array = pa.array(df[col], from_pandas=True)
+            if _has_empty_struct(array.type):
+                raise pa.ArrowInvalid(f"column '{col}' contains empty structs")
+        except _arrow_errors():
+            cleaned = _clean_column(df[col]) if col in object_cols else None
+            if cleaned is None:
+                raise
+            array = pa.array(cleaned, from_pandas=True)
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+
+def _write_parquet(df, path):
+    """
+    Write a DataFrame to parquet with pyarrow.
+    Falls back to JSON-serialized nested values if Arrow cannot store them natively.
+    """
+    try:
+        table = _to_arrow_table(df)
+        pq.write_table(table, path, **PARQUET_WRITE_OPTIONS)
+    except _arrow_errors() as e:
+        output.warn(f"Native parquet failed ({e}), using serialized format")
+        table = pa.Table.from_pandas(serialize_for_text_format(df), preserve_index=False, safe=False)
+        pq.write_table(table, path, **PARQUET_WRITE_OPTIONS)
+
+
+def _file_size(path):
+    """Return a file's size in bytes with a single stat call, or None if it is missing."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
 
 
 def save_results(df, prefix, query_terms=None, format=None, raw_data=None):
@@ -449,118 +773,306 @@ def save_results(df, prefix, query_terms=None, format=None, raw_data=None):
         format = DEFAULT_FORMAT
 
     filename = generate_filename(prefix, query_terms)
-
-    # Clean DataFrame for parquet (ensure consistent types per column)
-    df_clean = clean_for_parquet(df)
+    output_dir = _output_dir()
 
     if format == 'dual':
         # Save both parquet and jsonl
-        parquet_path = OUTPUT_DIR / f"{filename}.parquet"
-        jsonl_path = OUTPUT_DIR / f"{filename}.jsonl"
+        parquet_path = output_dir / f"{filename}.parquet"
+        jsonl_path = output_dir / f"{filename}.jsonl"
 
-        try:
-            df_clean.to_parquet(parquet_path, index=False)
-        except Exception as e:
-            output.warn(f"Native parquet failed ({e}), using serialized format")
-            df_serialized = serialize_for_text_format(df)
-            df_serialized.to_parquet(parquet_path, index=False)
-
-        # JSONL from raw data (preserves original nested structures)
-        if raw_data:
-            with open(jsonl_path, 'w') as f:
-                for record in raw_data:
-                    f.write(json.dumps(record, default=str) + '\n')
-        else:
-            df.to_json(jsonl_path, orient='records', lines=True)
+        # JSONL is written on a worker thread while pyarrow encodes the parquet file
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            jsonl_future = executor.submit(_save_jsonl, jsonl_path, df, raw_data)
+            _write_parquet(df, parquet_path)
+            jsonl_future.result()
 
         # Record output files
-        parquet_size = parquet_path.stat().st_size if parquet_path.exists() else None
-        jsonl_size = jsonl_path.stat().st_size if jsonl_path.exists() else None
-        output.add_output_file(parquet_path, 'parquet', rows=len(df), size_bytes=parquet_size)
-        output.add_output_file(jsonl_path, 'jsonl', rows=len(df), size_bytes=jsonl_size)
+        output.add_output_file(parquet_path, 'parquet', rows=len(df), size_bytes=_file_size(parquet_path),
+                               columns=list(df.columns))
+        output.add_output_file(jsonl_path, 'jsonl', rows=len(df), size_bytes=_file_size(jsonl_path))
 
         return {'parquet': str(parquet_path), 'jsonl': str(jsonl_path)}
 
     elif format == 'parquet':
-        filepath = OUTPUT_DIR / f"{filename}.parquet"
-        try:
-            df_clean.to_parquet(filepath, index=False)
-        except Exception as e:
-            output.warn(f"Native parquet failed ({e}), using serialized format")
-            df_serialized = serialize_for_text_format(df)
-            df_serialized.to_parquet(filepath, index=False)
-        output.add_output_file(filepath, 'parquet', rows=len(df),
-                               size_bytes=filepath.stat().st_size if filepath.exists() else None)
+        filepath = output_dir / f"{filename}.parquet"
+        _write_parquet(df, filepath)
+        output.add_output_file(filepath, 'parquet', rows=len(df), size_bytes=_file_size(filepath),
+                               columns=list(df.columns))
     elif format == 'jsonl':
-        filepath = OUTPUT_DIR / f"{filename}.jsonl"
-        if raw_data:
-            with open(filepath, 'w') as f:
-                for record in raw_data:
-                    f.write(json.dumps(record, default=str) + '\n')
-        else:
-            df.to_json(filepath, orient='records', lines=True)
-        output.add_output_file(filepath, 'jsonl', rows=len(df),
-                               size_bytes=filepath.stat().st_size if filepath.exists() else None)
+        filepath = output_dir / f"{filename}.jsonl"
+        _save_jsonl(filepath, df, raw_data)
+        output.add_output_file(filepath, 'jsonl', rows=len(df), size_bytes=_file_size(filepath))
     elif format == 'tsv':
-        filepath = OUTPUT_DIR / f"{filename}.tsv"
+        filepath = output_dir / f"{filename}.tsv"
         df_serialized = serialize_for_text_format(df)
         df_serialized.to_csv(filepath, index=False, sep='\t')
-        output.add_output_file(filepath, 'tsv', rows=len(df),
-                               size_bytes=filepath.stat().st_size if filepath.exists() else None)
+        output.add_output_file(filepath, 'tsv', rows=len(df), size_bytes=_file_size(filepath))
     elif format == 'csv':
-        filepath = OUTPUT_DIR / f"{filename}.csv"
+        filepath = output_dir / f"{filename}.csv"
         df_serialized = serialize_for_text_format(df)
         df_serialized.to_csv(filepath, index=False)
-        output.add_output_file(filepath, 'csv', rows=len(df),
-                               size_bytes=filepath.stat().st_size if filepath.exists() else None)
+        output.add_output_file(filepath, 'csv', rows=len(df), size_bytes=_file_size(filepath))
     else:
         # Default to parquet
-        filepath = OUTPUT_DIR / f"{filename}.parquet"
-        df_clean.to_parquet(filepath, index=False)
-        output.add_output_file(filepath, 'parquet', rows=len(df),
-                               size_bytes=filepath.stat().st_size if filepath.exists() else None)
+        filepath = output_dir / f"{filename}.parquet"
+        _write_parquet(df, filepath)
+        output.add_output_file(filepath, 'parquet', rows=len(df), size_bytes=_file_size(filepath),
+                               columns=list(df.columns))
 
     return str(filepath)
 
 
+# Formats that query_iterative can write page by page
+STREAMING_FORMATS = frozenset({'dual', 'parquet', 'jsonl'})
+# Streamed pages are buffered into parquet row groups of at least this many rows
+STREAM_ROW_GROUP_ROWS = 50_000
+
+
+def _conform_to_schema(table, schema):
+    """
+    Align one page's Arrow table with the stream schema fixed by the first page.
+    Missing columns become nulls; values that cannot take the column's type are
+    JSON-serialized for string columns and dropped (with a warning) otherwise.
+    """
+    names = set(table.column_names)
+    extra = names.difference(schema.names)
+    if extra:
+        output.warn(f"Dropping columns not present in the first page: {', '.join(sorted(extra))}")
+
+    arrays = []
+    for field in schema:
+        if field.name not in names:
+            arrays.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table[field.name]
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except _arrow_errors():
+                if pa.types.is_string(field.type):
+                    column = pa.array([v if v is None or isinstance(v, str) else _dumps(v)
+                                       for v in column.to_pylist()], type=pa.string())
+                else:
+                    output.warn(f"Column '{field.name}' changed type across pages; values dropped")
+                    column = pa.nulls(table.num_rows, field.type)
+        arrays.append(column)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class ResultStream:
+    """
+    Write paginated results to disk page by page (parquet and/or JSONL), so memory use
+    stays at a few pages instead of the whole result set. Parquet pages are buffered
+    into row groups of STREAM_ROW_GROUP_ROWS so each page does not add its own row
+    group (and footer metadata) to the file.
+    """
+
+    def __init__(self, prefix, query_terms=None, format=None):
+        format = format or DEFAULT_FORMAT
+        filename = generate_filename(prefix, query_terms)
+        output_dir = _output_dir()
+        self.format = format
+        self.parquet_path = output_dir / f"{filename}.parquet" if format in ('dual', 'parquet') else None
+        self.jsonl_path = output_dir / f"{filename}.jsonl" if format in ('dual', 'jsonl') else None
+        self.rows = 0
+        self._writer = None
+        self._pending = []  # Conformed page tables not yet written as a row group
+        self._pending_rows = 0
+        self._jsonl = open(self.jsonl_path, 'wb', buffering=1 << 20) if self.jsonl_path else None
+
+    def write(self, records, df):
+        """Append one page: raw records go to JSONL, the normalized DataFrame to parquet."""
+        if self._jsonl is not None:
+            _write_jsonl_records(self._jsonl, records)
+        if self.parquet_path is not None:
+            try:
+                table = _to_arrow_table(df)
+            except _arrow_errors():
+                table = pa.Table.from_pandas(serialize_for_text_format(df), preserve_index=False, safe=False)
+            if self._writer is None:
+                # Columns that are all null on the first page are stored as strings
+                schema = pa.schema([pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                                    for f in table.schema])
+                self._writer = pq.ParquetWriter(self.parquet_path, schema, **PARQUET_WRITE_OPTIONS)
+            self._pending.append(_conform_to_schema(table, self._writer.schema))
+            self._pending_rows += table.num_rows
+            if self._pending_rows >= STREAM_ROW_GROUP_ROWS:
+                self._flush()
+        self.rows += len(records)
+
+    def _flush(self):
+        """Write the buffered pages to parquet as one row group."""
+        if self._pending:
+            table = pa.concat_tables(self._pending)
+            self._writer.write_table(table, row_group_size=table.num_rows)
+            self._pending = []
+            self._pending_rows = 0
+
+    def _close_files(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def close(self):
+        """Finish the files, record them as outputs and return the path(s) like save_results."""
+        self._flush()
+        self._close_files()
+        saved = {}
+        if self.parquet_path is not None and self.parquet_path.exists():
+            output.add_output_file(self.parquet_path, 'parquet', rows=self.rows,
+                                   size_bytes=_file_size(self.parquet_path),
+                                   columns=pq.read_schema(self.parquet_path).names)
+            saved['parquet'] = str(self.parquet_path)
+        if self.jsonl_path is not None:
+            output.add_output_file(self.jsonl_path, 'jsonl', rows=self.rows,
+                                   size_bytes=_file_size(self.jsonl_path))
+            saved['jsonl'] = str(self.jsonl_path)
+        if self.format == 'dual':
+            return saved
+        return next(iter(saved.values()), None)
+
+    def discard(self):
+        """Close and remove the files (nothing was written)."""
+        self._pending = []
+        self._close_files()
+        for path in (self.parquet_path, self.jsonl_path):
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+
 # ============================================================================
 # QUERY FUNCTIONS
 # ============================================================================
 
-def query_iterative(dsl_query, max_results=None, batch_size=1000, save=True, save_format=None):
+# Patterns used by query_iterative to rewrite queries and detect the returned source
+_LIMIT_SKIP_RE = re.compile(r'\s+(?:limit|skip)\s+\d+', re.IGNORECASE)
+# Record sources the DSL can return
+SOURCE_NAMES = frozenset(('publications', 'grants', 'patents', 'clinical_trials', 'policy_documents',
+                          'datasets', 'source_titles', 'reports', 'researchers', 'organizations'))
+_SOURCE_ALTERNATION = '(' + '|'.join(sorted(SOURCE_NAMES)) + ')'
+_RETURN_SOURCE_RE = re.compile(r'return\s+' + _SOURCE_ALTERNATION, re.IGNORECASE)
+# Captures the searched source and, when present, the quoted search terms
+_SEARCH_QUERY_RE = re.compile(
+    r'search\s+' + _SOURCE_ALTERNATION + r'(?:\s+in\s+\w+)?(?:\s+for\s+"([^"]*)")?', re.IGNORECASE)
+
+# Pages fetched concurrently by query_iterative (default, and hard cap to stay polite to the API)
+DEFAULT_CONCURRENCY = 8
+MAX_CONCURRENT_PAGES = 16
+
+
+def _fetch_page(base_query, source_name, batch_size, skip):
+    """Fetch one page of a paginated query. Returns (records, count_total, duration)."""
+    call_start = time.time()
+    result = _get_client().query(f"{base_query} limit {batch_size} skip {skip}")
+    call_duration = time.time() - call_start
+
+    # dimcli mirrors the parsed response dict as attributes, so read the dict directly
+    batch_data = result.json.get(source_name) or []
+    return batch_data, result.count_total, call_duration
+
+
+def _fetch_pages(base_query, source_name, batch_size, skips, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Fetch several pages on a bounded thread pool (at most `concurrency` in flight), in skip order.
+    A page that fails yields its exception in place of the result.
+    """
+    def fetch(skip):
+        try:
+            return _fetch_page(base_query, source_name, batch_size, skip)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(fetch, skips))
+
+
+def _normalize_batch(records, col_kinds=None):
+    """
+    Build a DataFrame from one page of raw records, flattening nested values:
+    list columns are joined with '; ' and dict columns expand into 'col.key' columns.
+
+    `col_kinds` maps column -> type of its first non-null value. Pass the same dict
+    for every page of a query so a column is flattened the same way on all pages.
+    """
+    if col_kinds is None:
+        col_kinds = {}
+
+    # Classify nested columns from the leading raw records instead of scanning each column;
+    # the same pass collects the column order, so pandas does not have to infer it
+    columns = {}
+    for rec in records[:20]:
+        for key, value in rec.items():
+            columns[key] = None
+            if value is not None and key not in col_kinds:
+                col_kinds[key] = type(value)
+
+    # Keys first seen after the leading records are appended in order of appearance
+    late_keys = set().union(*map(dict.keys, records)).difference(columns)
+    if late_keys:
+        columns.update((key, None) for rec in records for key in rec if key in late_keys)
+
+    # Columns still unclassified were null throughout the sample: find their first value
+    unclassified = set(columns).difference(col_kinds)
+    for rec in records[20:]:
+        if not unclassified:
+            break
+        for key in unclassified.intersection(rec):
+            if rec[key] is not None:
+                col_kinds[key] = type(rec[key])
+                unclassified.discard(key)
+
+    df = pd.DataFrame.from_records(records, columns=list(columns))
+
+    dict_cols = []
+    for col in df.columns:
+        kind = col_kinds.get(col)
+        if kind is dict:
+            dict_cols.append(col)
+        elif kind is list:
+            values = df[col].to_numpy(copy=False)
+            df[col] = ['; '.join(map(str, x)) if isinstance(x, list) else x for x in values]
+
+    # Expand every dict column, then attach them all with one concat
+    if dict_cols:
+        expansions = [
+            pd.json_normalize([x if isinstance(x, dict) else {} for x in df[col].to_numpy(copy=False)])
+            .add_prefix(f"{col}.")
+            for col in dict_cols
+        ]
+        df = pd.concat([df.drop(columns=dict_cols)] + expansions, axis=1)
+    return df
+
+
+def query_iterative(dsl_query, max_results=None, batch_size=1000, save=True, save_format=None,
+                    concurrency=DEFAULT_CONCURRENCY, stream=False):
     """
     Execute a DSL query with automatic pagination to retrieve more than 1000 results.
+    After the first page, up to `concurrency` pages are fetched in parallel.
+
+    With stream=True (and a parquet, dual or jsonl format), each page is written to disk
+    as soon as it arrives and dropped from memory: 'data' then holds only the first page
+    and 'dataframe' is empty, so load the saved file to work with the full result.
     """
     batch_size = min(batch_size, 1000)  # API limit
+    concurrency = max(1, min(concurrency, MAX_CONCURRENT_PAGES))
+    save_format = save_format or DEFAULT_FORMAT
 
     # Remove any existing limit/skip from query
-    base_query = dsl_query.strip()
-    for keyword in ['limit', 'skip']:
-        if keyword in base_query.lower():
-            import re
-            base_query = re.sub(rf'\s+{keyword}\s+\d+', '', base_query, flags=re.IGNORECASE)
-
-    all_results = []
-    skip = 0
-    total_count = None
-    source_name = None
-
-    # Detect source name from query
-    for source in ['publications', 'grants', 'patents', 'clinical_trials',
-                   'policy_documents', 'datasets', 'source_titles', 'reports',
-                   'researchers', 'organizations']:
-        if f'return {source}' in base_query.lower():
-            source_name = source
-            break
+    base_query = _LIMIT_SKIP_RE.sub('', dsl_query.strip())
 
-    if not source_name:
-        for source in ['publications', 'grants', 'patents', 'clinical_trials']:
-            if f'search {source}' in base_query.lower():
-                source_name = source
-                break
+    all_results = []   # Raw records (kept for JSONL output and the 'data' field)
+    page_frames = []   # One normalized DataFrame per page, concatenated once at the end
+    retrieved = 0
+    total_count = None
 
-    if not source_name:
-        source_name = 'results'
+    # Detect source name (the returned source wins) and search terms from the query
+    search_match = _SEARCH_QUERY_RE.search(base_query)
+    match = _RETURN_SOURCE_RE.search(base_query) or search_match
+    source_name = match.group(1).lower() if match else 'results'
+    query_terms = (search_match.group(2) or None) if search_match else None
 
     output.set_query(base_query + f" limit {batch_size} [paginated]")
 
@@ -577,85 +1089,116 @@ def query_iterative(dsl_query, max_results=None, batch_size=1000, save=True, sav
             'cancelled': True
         }
 
-    output.step(2, 4, "Executing paginated API calls")
+    if stream and save and save_format not in STREAMING_FORMATS:
+        output.warn(f"Format '{save_format}' cannot be streamed; saving after pagination instead")
+    streamer = (ResultStream(source_name, query_terms, save_format)
+                if stream and save and save_format in STREAMING_FORMATS else None)
+
+    col_kinds = {}  # Column classification shared by every page (see _normalize_batch)
+
+    def collect(records):
+        nonlocal retrieved
+        retrieved += len(records)
+        frame = _normalize_batch(records, col_kinds)
+        if streamer is not None:
+            streamer.write(records, frame)
+            if not all_results:
+                all_results.extend(records)  # Keep the first page as a preview
+        else:
+            all_results.extend(records)
+            page_frames.append(frame)
 
-    page_num = 0
-    while True:
-        page_num += 1
-        paginated_query = f"{base_query} limit {batch_size} skip {skip}"
+    output.step(2, 4, "Executing paginated API calls")
 
-        call_start = time.time()
+    try:
+        # First page runs alone: it tells us how many pages remain
         try:
-            result = _get_client().query(paginated_query)
-            call_duration = time.time() - call_start
-
-            if total_count is None:
-                total_count = result.count_total or 0
-                if max_results:
-                    total_count = min(total_count, max_results)
-                total_pages = (total_count // batch_size) + 1
-
-            batch_data = getattr(result, source_name, [])
-            if not batch_data:
-                batch_data = result.json.get(source_name, [])
-
-            if not batch_data:
-                break
-
-            output.api_call(page_num, total_pages, len(batch_data), call_duration)
-
-            all_results.extend(batch_data)
-            skip += batch_size
-
-            if len(all_results) >= total_count:
-                break
-            if max_results and len(all_results) >= max_results:
-                break
-            if len(batch_data) < batch_size:
-                break
-
+            batch_data, count_total, call_duration = _fetch_page(base_query, source_name, batch_size, 0)
+            total_count = count_total or 0
+            if max_results:
+                total_count = min(total_count, max_results)
+            total_pages = (total_count // batch_size) + 1
         except Exception as e:
-            output.warn(f"Error at skip={skip}: {e}")
-            break
-
-    output.step_done(2, 4, f"Retrieved {len(all_results)} records")
-    output.records_retrieved = len(all_results)
+            output.warn(f"Error at skip=0: {e}")
+            batch_data = []
+
+        if batch_data:
+            output.api_call(1, total_pages, len(batch_data), call_duration)
+            collect(batch_data)
+
+        # Remaining pages are independent skip offsets, so fetch them concurrently.
+        # When streaming, fetch one window at a time so only `concurrency` pages are held.
+        if batch_data and len(batch_data) == batch_size and retrieved < total_count:
+            skips = list(range(batch_size, total_count, batch_size))
+            window = concurrency if streamer is not None else len(skips)
+            page_num = 1
+            done = False
+
+            for start in range(0, len(skips), window):
+                window_skips = skips[start:start + window]
+                pages = _fetch_pages(base_query, source_name, batch_size, window_skips, concurrency)
+
+                for i, skip in enumerate(window_skips):
+                    # Drop the window's reference so a streamed page is freed once written
+                    page, pages[i] = pages[i], None
+                    page_num += 1
+                    if isinstance(page, Exception):
+                        output.warn(f"Error at skip={skip}: {page}")
+                        done = True
+                        break
+
+                    batch_data, _, call_duration = page
+                    if not batch_data:
+                        done = True
+                        break
+
+                    output.api_call(page_num, total_pages, len(batch_data), call_duration)
+                    collect(batch_data)
+
+                    if len(batch_data) < batch_size:
+                        done = True
+                        break
+                del pages, page, batch_data
+                if done:
+                    break
+    except BaseException:
+        if streamer is not None:
+            streamer.close()
+        raise
+
+    output.step_done(2, 4, f"Retrieved {retrieved} records")
+    output.records_retrieved = retrieved
+
+    # Nothing came back: skip the DataFrame and save stages entirely
+    if not retrieved:
+        if streamer is not None:
+            streamer.discard()
+        return {
+            'total': total_count,
+            'retrieved': 0,
+            'data': all_results,
+            'dataframe': pd.DataFrame(),
+            'saved_to': None,
+            'query': dsl_query
+        }
 
-    # Convert to DataFrame
+    # Convert to DataFrame (pages were normalized as they arrived)
     output.step(3, 4, "Processing results")
-    df = pd.DataFrame(all_results)
-
-    if not df.empty:
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                sample = df[col].dropna().iloc[0] if not df[col].dropna().empty else None
-                if isinstance(sample, dict):
-                    expanded = pd.json_normalize(df[col].apply(lambda x: x if isinstance(x, dict) else {}))
-                    expanded.columns = [f"{col}.{c}" for c in expanded.columns]
-                    df = pd.concat([df.drop(columns=[col]), expanded], axis=1)
-                elif isinstance(sample, list):
-                    df[col] = df[col].apply(lambda x: '; '.join(str(i) for i in x) if isinstance(x, list) else x)
-
+    df = pd.concat(page_frames, ignore_index=True) if page_frames else pd.DataFrame()
     output.step_done(3, 4, "Results processed")
 
-    # Extract query terms for filename
-    query_terms = None
-    if 'for "' in dsl_query:
-        start = dsl_query.find('for "') + 5
-        end = dsl_query.find('"', start)
-        if end > start:
-            query_terms = dsl_query[start:end]
-
     # Save results
     output.step(4, 4, "Saving results")
     saved_path = None
-    if save and not df.empty:
+    if streamer is not None:
+        saved_path = streamer.close()
+    elif save:
         saved_path = save_results(df, source_name, query_terms, save_format, raw_data=all_results)
     output.step_done(4, 4, "Results saved")
 
     return {
         'total': total_count,
-        'retrieved': len(all_results),
+        'retrieved': retrieved,
         'data': all_results,
         'dataframe': df,
         'saved_to': saved_path,
@@ -663,297 +1206,92 @@ def query_iterative(dsl_query, max_results=None, batch_size=1000, save=True, sav
     }
 
 
-def search_publications(query_terms, filters=None, fields=None, limit=20, skip=0,
-                        iterative=False, max_results=None, save=True):
-    """Search publications with optional filters."""
-    dsl = f'search publications for "{query_terms}"'
+# DSL fragments for each searchable source, formatted once at import time:
+# (search with terms, search without terms, plain return, return with fields)
+SEARCH_TEMPLATES = {
+    src: (f'search {src} for "{{}}"', f'search {src}', f' return {src}', f' return {src}[{{}}]')
+    for src in ('publications', 'grants', 'patents', 'clinical_trials', 'researchers')
+}
 
-    if filters:
-        dsl += f' where {filters}'
 
-    if fields:
-        dsl += f' return publications[{fields}]'
-    else:
-        dsl += ' return publications'
+def _search(source, query_terms=None, filters=None, fields=None, limit=20, skip=0,
+            iterative=False, max_results=None, save=True):
+    """Search a source with optional filters (shared body of the search_* functions)."""
+    with_terms, without_terms, return_all, return_fields = SEARCH_TEMPLATES[source]
+    base = ''.join((
+        with_terms.format(query_terms) if query_terms else without_terms,
+        f' where {filters}' if filters else '',
+        return_fields.format(fields) if fields else return_all,
+    ))
 
     if iterative or (max_results and max_results > 1000):
-        result = query_iterative(dsl, max_results=max_results, save=save)
+        result = query_iterative(base, max_results=max_results, save=save)
         return {
             'total': result['total'],
             'returned': result['retrieved'],
             'saved_to': result['saved_to'],
-            'publications': result['data'][:20],
+            source: result['data'][:20],
             'query': result['query']
         }
 
-    dsl += f' limit {limit}'
-    if skip > 0:
-        dsl += f' skip {skip}'
+    dsl = f'{base} limit {limit} skip {skip}' if skip > 0 else f'{base} limit {limit}'
 
     output.set_query(dsl)
 
     # Confirm in interactive mode
     if not output.confirm(estimated_calls=1, estimated_records=limit):
-        return {'total': 0, 'returned': 0, 'saved_to': None, 'publications': [], 'query': dsl, 'cancelled': True}
+        return {'total': 0, 'returned': 0, 'saved_to': None, source: [], 'query': dsl, 'cancelled': True}
 
     output.step(2, 3, "Executing API call")
     call_start = time.time()
-    result = _get_client().query(dsl)
+    result = _cached_query(dsl)
     call_duration = time.time() - call_start
 
-    publications = result.publications if hasattr(result, 'publications') else []
-    output.api_call(1, 1, len(publications), call_duration)
-    output.records_retrieved = len(publications)
-    output.step_done(2, 3, f"Retrieved {len(publications)} publications")
-
-    # Save to file
-    output.step(3, 3, "Saving results")
-    saved_path = None
-    if save and publications:
-        df = pd.DataFrame(publications)
-        saved_path = save_results(df, 'publications', query_terms, raw_data=publications)
-    output.step_done(3, 3, "Results saved")
-
-    return {
-        'total': result.count_total,
-        'returned': len(publications),
-        'saved_to': saved_path,
-        'publications': publications,
-        'query': dsl
-    }
-
-
-def search_grants(query_terms, filters=None, fields=None, limit=20, skip=0,
-                  iterative=False, max_results=None, save=True):
-    """Search grants with optional filters."""
-    dsl = f'search grants for "{query_terms}"'
-
-    if filters:
-        dsl += f' where {filters}'
-
-    if fields:
-        dsl += f' return grants[{fields}]'
+    records = result.json.get(source) or []
+    if result.cached:
+        output.log("Served from the query cache (no API call)")
     else:
-        dsl += ' return grants'
-
-    if iterative or (max_results and max_results > 1000):
-        result = query_iterative(dsl, max_results=max_results, save=save)
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': result['saved_to'],
-            'grants': result['data'][:20],
-            'query': result['query']
-        }
-
-    dsl += f' limit {limit}'
-    if skip > 0:
-        dsl += f' skip {skip}'
-
-    output.set_query(dsl)
-
-    if not output.confirm(estimated_calls=1, estimated_records=limit):
-        return {'total': 0, 'returned': 0, 'saved_to': None, 'grants': [], 'query': dsl, 'cancelled': True}
-
-    output.step(2, 3, "Executing API call")
-    call_start = time.time()
-    result = _get_client().query(dsl)
-    call_duration = time.time() - call_start
-
-    grants = result.grants if hasattr(result, 'grants') else []
-    output.api_call(1, 1, len(grants), call_duration)
-    output.records_retrieved = len(grants)
-    output.step_done(2, 3, f"Retrieved {len(grants)} grants")
-
-    output.step(3, 3, "Saving results")
-    saved_path = None
-    if save and grants:
-        df = pd.DataFrame(grants)
-        saved_path = save_results(df, 'grants', query_terms, raw_data=grants)
-    output.step_done(3, 3, "Results saved")
-
-    return {
-        'total': result.count_total,
-        'returned': len(grants),
-        'saved_to': saved_path,
-        'grants': grants,
-        'query': dsl
-    }
-
-
-def search_patents(query_terms, filters=None, fields=None, limit=20, skip=0,
-                   iterative=False, max_results=None, save=True):
-    """Search patents with optional filters."""
-    dsl = f'search patents for "{query_terms}"'
-
-    if filters:
-        dsl += f' where {filters}'
-
-    if fields:
-        dsl += f' return patents[{fields}]'
-    else:
-        dsl += ' return patents'
-
-    if iterative or (max_results and max_results > 1000):
-        result = query_iterative(dsl, max_results=max_results, save=save)
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': result['saved_to'],
-            'patents': result['data'][:20],
-            'query': result['query']
-        }
-
-    dsl += f' limit {limit}'
-    if skip > 0:
-        dsl += f' skip {skip}'
-
-    output.set_query(dsl)
-
-    if not output.confirm(estimated_calls=1, estimated_records=limit):
-        return {'total': 0, 'returned': 0, 'saved_to': None, 'patents': [], 'query': dsl, 'cancelled': True}
-
-    output.step(2, 3, "Executing API call")
-    call_start = time.time()
-    result = _get_client().query(dsl)
-    call_duration = time.time() - call_start
-
-    patents = result.patents if hasattr(result, 'patents') else []
-    output.api_call(1, 1, len(patents), call_duration)
-    output.records_retrieved = len(patents)
-    output.step_done(2, 3, f"Retrieved {len(patents)} patents")
+        output.api_call(1, 1, len(records), call_duration)
+    output.records_retrieved = len(records)
+    output.step_done(2, 3, f"Retrieved {len(records)} {source.replace('_', ' ')}")
 
+    # Save to file
     output.step(3, 3, "Saving results")
     saved_path = None
-    if save and patents:
-        df = pd.DataFrame(patents)
-        saved_path = save_results(df, 'patents', query_terms, raw_data=patents)
+    if save and records:
+        df = pd.DataFrame(records)
+        saved_path = save_results(df, source, query_terms, raw_data=records)
     output.step_done(3, 3, "Results saved")
 
     return {
         'total': result.count_total,
-        'returned': len(patents),
+        'returned': len(records),
         'saved_to': saved_path,
-        'patents': patents,
+        source: records,
         'query': dsl
     }
 
 
-def search_clinical_trials(query_terms, filters=None, fields=None, limit=20, skip=0,
-                           iterative=False, max_results=None, save=True):
-    """Search clinical trials with optional filters."""
-    dsl = f'search clinical_trials for "{query_terms}"'
+def _make_search(source, doc):
+    """Bind _search to one source, named and documented like a regular function."""
+    search = functools.partial(_search, source)
+    search.__name__ = search.__qualname__ = f'search_{source}'
+    search.__doc__ = doc
+    return search
 
-    if filters:
-        dsl += f' where {filters}'
 
-    if fields:
-        dsl += f' return clinical_trials[{fields}]'
-    else:
-        dsl += ' return clinical_trials'
-
-    if iterative or (max_results and max_results > 1000):
-        result = query_iterative(dsl, max_results=max_results, save=save)
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': result['saved_to'],
-            'clinical_trials': result['data'][:20],
-            'query': result['query']
-        }
-
-    dsl += f' limit {limit}'
-    if skip > 0:
-        dsl += f' skip {skip}'
-
-    output.set_query(dsl)
-
-    if not output.confirm(estimated_calls=1, estimated_records=limit):
-        return {'total': 0, 'returned': 0, 'saved_to': None, 'clinical_trials': [], 'query': dsl, 'cancelled': True}
-
-    output.step(2, 3, "Executing API call")
-    call_start = time.time()
-    result = _get_client().query(dsl)
-    call_duration = time.time() - call_start
-
-    trials = result.clinical_trials if hasattr(result, 'clinical_trials') else []
-    output.api_call(1, 1, len(trials), call_duration)
-    output.records_retrieved = len(trials)
-    output.step_done(2, 3, f"Retrieved {len(trials)} trials")
-
-    output.step(3, 3, "Saving results")
-    saved_path = None
-    if save and trials:
-        df = pd.DataFrame(trials)
-        saved_path = save_results(df, 'clinical_trials', query_terms, raw_data=trials)
-    output.step_done(3, 3, "Results saved")
-
-    return {
-        'total': result.count_total,
-        'returned': len(trials),
-        'saved_to': saved_path,
-        'clinical_trials': trials,
-        'query': dsl
-    }
+search_publications = _make_search('publications', "Search publications with optional filters.")
+search_grants = _make_search('grants', "Search grants with optional filters.")
+search_patents = _make_search('patents', "Search patents with optional filters.")
+search_clinical_trials = _make_search('clinical_trials', "Search clinical trials with optional filters.")
 
 
+# Researchers take no skip, so positional calls keep this parameter order
 def search_researchers(query_terms=None, filters=None, fields=None, limit=20,
                        iterative=False, max_results=None, save=True):
     """Search researchers with optional filters."""
-    if query_terms:
-        dsl = f'search researchers for "{query_terms}"'
-    else:
-        dsl = 'search researchers'
-
-    if filters:
-        dsl += f' where {filters}'
-
-    if fields:
-        dsl += f' return researchers[{fields}]'
-    else:
-        dsl += ' return researchers'
-
-    if iterative or (max_results and max_results > 1000):
-        result = query_iterative(dsl, max_results=max_results, save=save)
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': result['saved_to'],
-            'researchers': result['data'][:20],
-            'query': result['query']
-        }
-
-    dsl += f' limit {limit}'
-
-    output.set_query(dsl)
-
-    if not output.confirm(estimated_calls=1, estimated_records=limit):
-        return {'total': 0, 'returned': 0, 'saved_to': None, 'researchers': [], 'query': dsl, 'cancelled': True}
-
-    output.step(2, 3, "Executing API call")
-    call_start = time.time()
-    result = _get_client().query(dsl)
-    call_duration = time.time() - call_start
-
-    researchers = result.researchers if hasattr(result, 'researchers') else []
-    output.api_call(1, 1, len(researchers), call_duration)
-    output.records_retrieved = len(researchers)
-    output.step_done(2, 3, f"Retrieved {len(researchers)} researchers")
-
-    output.step(3, 3, "Saving results")
-    saved_path = None
-    if save and researchers:
-        df = pd.DataFrame(researchers)
-        saved_path = save_results(df, 'researchers', query_terms, raw_data=researchers)
-    output.step_done(3, 3, "Results saved")
-
-    return {
-        'total': result.count_total,
-        'returned': len(researchers),
-        'saved_to': saved_path,
-        'researchers': researchers,
-        'query': dsl
-    }
+    return _search('researchers', query_terms, filters, fields, limit,
+                   iterative=iterative, max_results=max_results, save=save)
 
 
 def aggregate_query(source, query_terms, facet, aggregate_by=None, filters=None,
@@ -966,17 +1304,13 @@ def aggregate_query(source, query_terms, facet, aggregate_by=None, filters=None,
         validate_aggregation_metrics(source, aggregate_by)
     output.step_done(1, 3, "Schema validated")
 
-    dsl = f'search {source} for "{query_terms}"'
-
-    if filters:
-        dsl += f' where {filters}'
-
-    dsl += f' return {facet}'
-
-    if aggregate_by:
-        dsl += f' aggregate {aggregate_by}'
-
-    dsl += f' limit {limit}'
+    dsl = ''.join((
+        f'search {source} for "{query_terms}"',
+        f' where {filters}' if filters else '',
+        f' return {facet}',
+        f' aggregate {aggregate_by}' if aggregate_by else '',
+        f' limit {limit}',
+    ))
 
     output.set_query(dsl)
 
@@ -1008,19 +1342,43 @@ def aggregate_query(source, query_terms, facet, aggregate_by=None, filters=None,
     }
 
 
-def extract_concepts(text, return_scores=False):
-    """Extract concepts from text."""
+def _extract_concepts_dsl(text, return_scores=False):
+    """Build an extract_concepts DSL call, escaping quotes in the text."""
     text = text.replace('"', '\\"')
     if return_scores:
-        dsl = f'extract_concepts("{text}", return_scores=true)'
-    else:
-        dsl = f'extract_concepts("{text}")'
+        return f'extract_concepts("{text}", return_scores=true)'
+    return f'extract_concepts("{text}")'
+
+
+def _classify_dsl(title, abstract, system):
+    """Build a classify DSL call, escaping quotes in the title and abstract."""
+    title = title.replace('"', '\\"')
+    abstract = abstract.replace('"', '\\"')
+    return f'classify(title="{title}", abstract="{abstract}", system="{system}")'
+
+
+def _extract_affiliations_dsl(affiliation_text):
+    """Build an extract_affiliations DSL call, escaping quotes in the text."""
+    affiliation_text = affiliation_text.replace('"', '\\"')
+    return f'extract_affiliations(affiliation="{affiliation_text}")'
+
+
+def _query_batch(dsls, concurrency):
+    """Run independent single-call queries on a bounded thread pool, in input order."""
+    concurrency = max(1, min(concurrency, MAX_CONCURRENT_PAGES))
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(_cached_query, dsls))
+
+
+def extract_concepts(text, return_scores=False):
+    """Extract concepts from text."""
+    dsl = _extract_concepts_dsl(text, return_scores)
 
     output.set_query(dsl)
 
     output.step(1, 1, "Extracting concepts")
-    result = _get_client().query(dsl)
-    output.api_calls = 1
+    result = _cached_query(dsl)
+    output.api_calls = 0 if result.cached else 1
     output.step_done(1, 1, "Concepts extracted")
 
     return {
@@ -1029,18 +1387,28 @@ def extract_concepts(text, return_scores=False):
     }
 
 
+def extract_concepts_batch(texts, return_scores=False, concurrency=DEFAULT_CONCURRENCY):
+    """Extract concepts from many texts, with up to `concurrency` calls in flight."""
+    dsls = [_extract_concepts_dsl(text, return_scores) for text in texts]
+
+    output.step(1, 1, f"Extracting concepts for {len(dsls)} texts")
+    results = _query_batch(dsls, concurrency)
+    output.api_calls = sum(not result.cached for result in results)
+    output.step_done(1, 1, "Concepts extracted")
+
+    return [{'concepts': result.json.get('extracted_concepts', []), 'query': dsl}
+            for dsl, result in zip(dsls, results)]
+
+
 def classify_text(title, abstract, system='FOR_2020'):
     """Classify text into research categories."""
-    title = title.replace('"', '\\"')
-    abstract = abstract.replace('"', '\\"')
-
-    dsl = f'classify(title="{title}", abstract="{abstract}", system="{system}")'
+    dsl = _classify_dsl(title, abstract, system)
 
     output.set_query(dsl)
 
     output.step(1, 1, "Classifying text")
-    result = _get_client().query(dsl)
-    output.api_calls = 1
+    result = _cached_query(dsl)
+    output.api_calls = 0 if result.cached else 1
     output.step_done(1, 1, "Classification complete")
 
     return {
@@ -1050,16 +1418,28 @@ def classify_text(title, abstract, system='FOR_2020'):
     }
 
 
+def classify_text_batch(pairs, system='FOR_2020', concurrency=DEFAULT_CONCURRENCY):
+    """Classify many (title, abstract) pairs, with up to `concurrency` calls in flight."""
+    dsls = [_classify_dsl(title, abstract, system) for title, abstract in pairs]
+
+    output.step(1, 1, f"Classifying {len(dsls)} texts")
+    results = _query_batch(dsls, concurrency)
+    output.api_calls = sum(not result.cached for result in results)
+    output.step_done(1, 1, "Classification complete")
+
+    return [{'system': system, 'classifications': result.json.get(system, []), 'query': dsl}
+            for dsl, result in zip(dsls, results)]
+
+
 def extract_affiliations(affiliation_text):
     """Extract and resolve organization from affiliation text."""
-    affiliation_text = affiliation_text.replace('"', '\\"')
-    dsl = f'extract_affiliations(affiliation="{affiliation_text}")'
+    dsl = _extract_affiliations_dsl(affiliation_text)
 
     output.set_query(dsl)
 
     output.step(1, 1, "Extracting affiliations")
-    result = _get_client().query(dsl)
-    output.api_calls = 1
+    result = _cached_query(dsl)
+    output.api_calls = 0 if result.cached else 1
     output.step_done(1, 1, "Affiliations extracted")
 
     return {
@@ -1068,20 +1448,30 @@ def extract_affiliations(affiliation_text):
     }
 
 
+def extract_affiliations_batch(affiliation_texts, concurrency=DEFAULT_CONCURRENCY):
+    """Extract organizations from many affiliation strings, with up to `concurrency` calls in flight."""
+    dsls = [_extract_affiliations_dsl(text) for text in affiliation_texts]
+
+    output.step(1, 1, f"Extracting affiliations for {len(dsls)} strings")
+    results = _query_batch(dsls, concurrency)
+    output.api_calls = sum(not result.cached for result in results)
+    output.step_done(1, 1, "Affiliations extracted")
+
+    return [{'results': result.json.get('results', []), 'query': dsl}
+            for dsl, result in zip(dsls, results)]
+
+
 def identify_experts(concepts, source='publications', filters=None, annotate_with=None,
                      limit=20, save=True):
     """Identify experts based on concepts."""
     concepts_str = ', '.join([f'"{c}"' for c in concepts])
-    dsl = f'identify experts from concepts [{concepts_str}] using {source}'
-
-    if filters:
-        dsl += f' where {filters}'
-
-    if annotate_with:
-        ids_str = ', '.join([f'"{id}"' for id in annotate_with])
-        dsl += f' annotate organizational, coauthorship overlap with [{ids_str}]'
-
-    dsl += f' return experts limit {limit}'
+    ids_str = ', '.join([f'"{id}"' for id in annotate_with]) if annotate_with else ''
+    dsl = ''.join((
+        f'identify experts from concepts [{concepts_str}] using {source}',
+        f' where {filters}' if filters else '',
+        f' annotate organizational, coauthorship overlap with [{ids_str}]' if annotate_with else '',
+        f' return experts limit {limit}',
+    ))
 
     output.set_query(dsl)
 
@@ -1119,17 +1509,17 @@ def describe_source(source_name):
     output.set_query(dsl)
 
     output.step(1, 1, f"Fetching schema for '{source_name}'")
-    result = _get_client().query(dsl)
-    output.api_calls = 1
+    schema = _load_cached_schema(f"describe_{source_name}")
+    if schema is None:
+        result = _cached_query(dsl)
+        output.api_calls = 0 if result.cached else 1
+        schema = {key: result.json.get(key, [])
+                  for key in ('fields', 'fieldsets', 'metrics', 'search_fields')}
+        if schema['fields']:
+            _save_cached_schema(f"describe_{source_name}", schema)
     output.step_done(1, 1, "Schema retrieved")
 
-    return {
-        'fields': result.json.get('fields', []),
-        'fieldsets': result.json.get('fieldsets', []),
-        'metrics': result.json.get('metrics', []),
-        'search_fields': result.json.get('search_fields', []),
-        'query': dsl
-    }
+    return {**schema, 'query': dsl}
 
 
 def raw_query(dsl_query, save=True, iterative=False, max_results=None):
@@ -1160,9 +1550,9 @@ def raw_query(dsl_query, save=True, iterative=False, max_results=None):
     output.step(2, 2, "Saving results")
     saved_path = None
     if save:
-        for source in ['publications', 'grants', 'patents', 'clinical_trials',
-                       'researchers', 'organizations', 'datasets', 'reports']:
-            data = result.json.get(source, [])
+        # Save the first non-empty record source in the response
+        for source in (key for key in result.json if key in SOURCE_NAMES):
+            data = result.json[source]
             if data:
                 df = pd.DataFrame(data)
                 saved_path = save_results(df, source, raw_data=data)
@@ -1191,11 +1581,11 @@ def raw_query(dsl_query, save=True, iterative=False, max_results=None):
 # MAIN ENTRY POINT
 # ============================================================================
 
-def main():
-    # Common arguments shared by all subcommands
+def _build_common_parser():
+    """Arguments shared by all subcommands."""
     common_parser = argparse.ArgumentParser(add_help=False)
     common_parser.add_argument('--no-save', action='store_true', help='Do not save results to file')
-    common_parser.add_argument('--format', choices=['dual', 'parquet', 'jsonl', 'tsv', 'csv'],
+    common_parser.add_argument('--format', choices=FORMAT_CHOICES,
                                default='dual', help='Output format (default: dual = parquet + jsonl)')
     common_parser.add_argument('--output-dir', '-o', type=str,
                                help='Output directory (default: /tmp/dimensions-results/)')
@@ -1207,28 +1597,12 @@ def main():
     mode_group.add_argument('--silent', '-s', action='store_true',
                             help='Silent mode - minimal output, only final JSON')
 
-    parser = argparse.ArgumentParser(
-        description='Dimensions DSL Helper - Query the Dimensions research database',
-        parents=[common_parser],
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Output Modes:
-  --verbose, -v      Step-by-step execution details (default)
-  --silent, -s       Minimal output, only final JSON result
+    # main() reads these straight off the Namespace; every parser inherits them from here
+    common_parser.set_defaults(silent=False, verbose=True, no_save=False, output_dir=None)
+    return common_parser
 
-Examples:
-  %(prog)s search-publications "machine learning" -l 50
-  %(prog)s search-grants "cancer" -f "funders.acronym=\\"NIH\\""
-  %(prog)s aggregate publications "AI" -F funders -a "citations_avg"
-  %(prog)s describe publications
-        """
-    )
 
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
-
-    # Search publications
-    pub_parser = subparsers.add_parser('search-publications', help='Search publications',
-                                       parents=[common_parser])
+def _add_publications_arguments(pub_parser):
     pub_parser.add_argument('query', help='Search query')
     pub_parser.add_argument('--filters', '-f', help='DSL where clause filters')
     pub_parser.add_argument('--fields', help='Fields to return')
@@ -1239,39 +1613,18 @@ Examples:
     pub_parser.add_argument('--max-results', '-m', type=int,
                             help='Maximum results (enables iterative if >1000)')
 
-    # Search grants
-    grant_parser = subparsers.add_parser('search-grants', help='Search grants',
-                                         parents=[common_parser])
-    grant_parser.add_argument('query', help='Search query')
-    grant_parser.add_argument('--filters', '-f', help='DSL where clause filters')
-    grant_parser.add_argument('--fields', help='Fields to return')
-    grant_parser.add_argument('--limit', '-l', type=int, default=20)
-    grant_parser.add_argument('--iterative', '-i', action='store_true')
-    grant_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search patents
-    patent_parser = subparsers.add_parser('search-patents', help='Search patents',
-                                          parents=[common_parser])
-    patent_parser.add_argument('query', help='Search query')
-    patent_parser.add_argument('--filters', '-f', help='DSL where clause filters')
-    patent_parser.add_argument('--fields', help='Fields to return')
-    patent_parser.add_argument('--limit', '-l', type=int, default=20)
-    patent_parser.add_argument('--iterative', '-i', action='store_true')
-    patent_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search clinical trials
-    trial_parser = subparsers.add_parser('search-trials', help='Search clinical trials',
-                                         parents=[common_parser])
-    trial_parser.add_argument('query', help='Search query')
-    trial_parser.add_argument('--filters', '-f', help='DSL where clause filters')
-    trial_parser.add_argument('--fields', help='Fields to return')
-    trial_parser.add_argument('--limit', '-l', type=int, default=20)
-    trial_parser.add_argument('--iterative', '-i', action='store_true')
-    trial_parser.add_argument('--max-results', '-m', type=int)
-
-    # Aggregate query
-    agg_parser = subparsers.add_parser('aggregate', help='Aggregation query',
-                                       parents=[common_parser])
+
+def _add_search_arguments(search_parser):
+    """Search grants, patents or clinical trials (same arguments for each)."""
+    search_parser.add_argument('query', help='Search query')
+    search_parser.add_argument('--filters', '-f', help='DSL where clause filters')
+    search_parser.add_argument('--fields', help='Fields to return')
+    search_parser.add_argument('--limit', '-l', type=int, default=20)
+    search_parser.add_argument('--iterative', '-i', action='store_true')
+    search_parser.add_argument('--max-results', '-m', type=int)
+
+
+def _add_aggregate_arguments(agg_parser):
     agg_parser.add_argument('source', help='Data source')
     agg_parser.add_argument('query', help='Search query')
     agg_parser.add_argument('--facet', '-F', required=True, help='Facet field')
@@ -1279,73 +1632,183 @@ Examples:
     agg_parser.add_argument('--filters', '-f', help='Filters')
     agg_parser.add_argument('--limit', '-l', type=int, default=20)
 
-    # Extract concepts
-    concept_parser = subparsers.add_parser('extract-concepts', help='Extract concepts from text',
-                                           parents=[common_parser])
+
+def _add_concepts_arguments(concept_parser):
     concept_parser.add_argument('text', help='Text to extract concepts from')
     concept_parser.add_argument('--scores', action='store_true', help='Include relevance scores')
 
-    # Classify
-    classify_parser = subparsers.add_parser('classify', help='Classify text',
-                                            parents=[common_parser])
+
+def _add_classify_arguments(classify_parser):
     classify_parser.add_argument('--title', required=True, help='Title')
     classify_parser.add_argument('--abstract', required=True, help='Abstract')
     classify_parser.add_argument('--system', default='FOR_2020', help='Classification system')
 
-    # Identify experts
-    expert_parser = subparsers.add_parser('identify-experts', help='Identify experts',
-                                          parents=[common_parser])
+
+def _add_experts_arguments(expert_parser):
     expert_parser.add_argument('--concepts', '-c', nargs='+', required=True, help='Concepts')
     expert_parser.add_argument('--filters', '-f', help='Filter clause')
     expert_parser.add_argument('--limit', '-l', type=int, default=20)
 
-    # Raw query
-    raw_parser = subparsers.add_parser('raw', help='Execute raw DSL query',
-                                       parents=[common_parser])
+
+def _add_raw_arguments(raw_parser):
     raw_parser.add_argument('query', help='DSL query string')
     raw_parser.add_argument('--iterative', '-i', action='store_true')
     raw_parser.add_argument('--max-results', '-m', type=int)
 
-    # Describe
-    desc_parser = subparsers.add_parser('describe', help='Describe a source',
-                                        parents=[common_parser])
+
+def _add_describe_arguments(desc_parser):
     desc_parser.add_argument('source', help='Source name')
 
-    args = parser.parse_args()
+
+# Subcommand name -> (help text, function adding its arguments), in --help listing order
+COMMAND_PARSERS = {
+    'search-publications': ('Search publications', _add_publications_arguments),
+    'search-grants': ('Search grants', _add_search_arguments),
+    'search-patents': ('Search patents', _add_search_arguments),
+    'search-trials': ('Search clinical trials', _add_search_arguments),
+    'aggregate': ('Aggregation query', _add_aggregate_arguments),
+    'extract-concepts': ('Extract concepts from text', _add_concepts_arguments),
+    'classify': ('Classify text', _add_classify_arguments),
+    'identify-experts': ('Identify experts', _add_experts_arguments),
+    'raw': ('Execute raw DSL query', _add_raw_arguments),
+    'describe': ('Describe a source', _add_describe_arguments),
+}
+
+
+def _run_search_publications(args, save):
+    return search_publications(args.query, args.filters, args.fields, args.limit, args.skip,
+                               iterative=args.iterative, max_results=args.max_results, save=save)
+
+
+def _run_search(search, args, save):
+    return search(args.query, args.filters, args.fields, args.limit,
+                  iterative=args.iterative, max_results=args.max_results, save=save)
+
+
+def _run_aggregate(args, save):
+    return aggregate_query(args.source, args.query, args.facet, args.aggregate, args.filters,
+                           args.limit, save=save)
+
+
+def _run_identify_experts(args, save):
+    return identify_experts(args.concepts, filters=args.filters, limit=args.limit, save=save)
+
+
+def _run_raw(args, save):
+    return raw_query(args.query, save=save, iterative=args.iterative, max_results=args.max_results)
+
+
+# Subcommand name -> (total steps, message for the first step, handler(args, save))
+COMMAND_HANDLERS = {
+    'search-publications': (3, "Query initialized", _run_search_publications),
+    'search-grants': (3, "Query initialized", functools.partial(_run_search, search_grants)),
+    'search-patents': (3, "Query initialized", functools.partial(_run_search, search_patents)),
+    'search-trials': (3, "Query initialized", functools.partial(_run_search, search_clinical_trials)),
+    'aggregate': (3, "Query initialized", _run_aggregate),
+    'extract-concepts': (1, "Ready", lambda args, save: extract_concepts(args.text, args.scores)),
+    'classify': (1, "Ready", lambda args, save: classify_text(args.title, args.abstract, args.system)),
+    'identify-experts': (2, "Query initialized", _run_identify_experts),
+    'raw': (2, "Query initialized", _run_raw),
+    'describe': (1, "Ready", lambda args, save: describe_source(args.source)),
+}
+
+
+# (header label, argparse attribute) pairs shown in the workflow header
+ARGS_SUMMARY_FIELDS = (
+    ('Query', 'query'),
+    ('Source', 'source'),
+    ('Filters', 'filters'),
+    ('Facet', 'facet'),
+    ('Limit', 'limit'),
+    ('Max Results', 'max_results'),
+)
+
+
+def _sniff_subcommand(argv):
+    """Return the first argument naming a known subcommand, or None."""
+    return next((arg for arg in argv if not arg.startswith('-') and arg in COMMAND_PARSERS), None)
+
+
+def _build_parser(command=None):
+    """
+    Build the CLI parser. Only `command` gets its full subparser (with the shared
+    arguments copied in); without one, every command is listed by name for --help.
+    """
+    common_parser = _build_common_parser()
+    parser = argparse.ArgumentParser(
+        description='Dimensions DSL Helper - Query the Dimensions research database',
+        parents=[common_parser],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Output Modes:
+  --verbose, -v      Step-by-step execution details (default)
+  --silent, -s       Minimal output, only final JSON result
+
+Examples:
+  %(prog)s search-publications "machine learning" -l 50
+  %(prog)s search-grants "cancer" -f "funders.acronym=\\"NIH\\""
+  %(prog)s aggregate publications "AI" -F funders -a "citations_avg"
+  %(prog)s describe publications
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+    if command is not None:
+        help_text, add_arguments = COMMAND_PARSERS[command]
+        add_arguments(subparsers.add_parser(command, help=help_text, parents=[common_parser]))
+    else:
+        for name, (help_text, _) in COMMAND_PARSERS.items():
+            subparsers.add_parser(name, help=help_text)
+    return parser
+
+
+def _parse_args(argv):
+    """
+    Parse the command line and return (parser, args).
+    When the first argument is a command, only that command's parser is built (named
+    as argparse would name the subparser); anything else goes through _build_parser.
+    """
+    if argv and argv[0] in COMMAND_PARSERS:
+        command = argv[0]
+        help_text, add_arguments = COMMAND_PARSERS[command]
+        parser = argparse.ArgumentParser(prog=f"{os.path.basename(sys.argv[0])} {command}",
+                                         parents=[_build_common_parser()])
+        add_arguments(parser)
+        args, extras = parser.parse_known_args(argv[1:], argparse.Namespace(command=command))
+        if not extras:
+            return parser, args
+
+    # Options before the command, help, no command, typos and unrecognized arguments
+    parser = _build_parser(_sniff_subcommand(argv))
+    return parser, parser.parse_args(argv)
+
+
+def main():
+    parser, args = _parse_args(sys.argv[1:])
 
     if not args.command:
         parser.print_help()
         return
 
-    # Set output mode
+    # The top-level parser and every subparser inherit common_parser, so its
+    # options (silent, output_dir, no_save, format) are always on the Namespace
     global output
-    if getattr(args, 'silent', False):
+    if args.silent:
         output = OutputMode(OutputMode.SILENT)
     else:
         output = OutputMode(OutputMode.VERBOSE)
 
     # Set output directory if specified
     global OUTPUT_DIR
-    if hasattr(args, 'output_dir') and args.output_dir:
-        OUTPUT_DIR = Path(args.output_dir)
-        OUTPUT_DIR.mkdir(exist_ok=True)
-
-    save = not getattr(args, 'no_save', False)
-
-    # Build args summary for header
-    args_summary = {}
-    if hasattr(args, 'query'):
-        args_summary['Query'] = args.query
-    if hasattr(args, 'source'):
-        args_summary['Source'] = args.source
-    if hasattr(args, 'filters') and args.filters:
-        args_summary['Filters'] = args.filters
-    if hasattr(args, 'facet') and args.facet:
-        args_summary['Facet'] = args.facet
-    if hasattr(args, 'limit'):
-        args_summary['Limit'] = args.limit
-    if hasattr(args, 'max_results') and args.max_results:
-        args_summary['Max Results'] = args.max_results
+    if args.output_dir:
+        OUTPUT_DIR = Path(args.output_dir)  # Created on first save
+
+    save = not args.no_save
+
+    # Build args summary for header (subcommand-specific, so absent, unset and empty ones are left out)
+    arg_values = vars(args)
+    args_summary = {label: value for label, attr in ARGS_SUMMARY_FIELDS
+                    if (value := arg_values.get(attr)) not in (None, '')}
 
     # Start workflow tracking
     output.start(args.command, args_summary)
@@ -1354,57 +1817,9 @@ Examples:
     result = None
 
     try:
-        if args.command == 'search-publications':
-            output.step_done(1, 3, "Query initialized")
-            result = search_publications(
-                args.query, args.filters, args.fields, args.limit, args.skip,
-                iterative=args.iterative, max_results=args.max_results, save=save
-            )
-        elif args.command == 'search-grants':
-            output.step_done(1, 3, "Query initialized")
-            result = search_grants(
-                args.query, args.filters, args.fields, args.limit,
-                iterative=args.iterative, max_results=args.max_results, save=save
-            )
-        elif args.command == 'search-patents':
-            output.step_done(1, 3, "Query initialized")
-            result = search_patents(
-                args.query, args.filters, args.fields, args.limit,
-                iterative=args.iterative, max_results=args.max_results, save=save
-            )
-        elif args.command == 'search-trials':
-            output.step_done(1, 3, "Query initialized")
-            result = search_clinical_trials(
-                args.query, args.filters, args.fields, args.limit,
-                iterative=args.iterative, max_results=args.max_results, save=save
-            )
-        elif args.command == 'aggregate':
-            output.step_done(1, 3, "Query initialized")
-            result = aggregate_query(
-                args.source, args.query, args.facet, args.aggregate, args.filters,
-                args.limit, save=save
-            )
-        elif args.command == 'extract-concepts':
-            output.step_done(1, 1, "Ready")
-            result = extract_concepts(args.text, args.scores)
-        elif args.command == 'classify':
-            output.step_done(1, 1, "Ready")
-            result = classify_text(args.title, args.abstract, args.system)
-        elif args.command == 'identify-experts':
-            output.step_done(1, 2, "Query initialized")
-            result = identify_experts(args.concepts, filters=args.filters,
-                                      limit=args.limit, save=save)
-        elif args.command == 'raw':
-            output.step_done(1, 2, "Query initialized")
-            result = raw_query(args.query, save=save, iterative=args.iterative,
-                              max_results=args.max_results)
-        elif args.command == 'describe':
-            output.step_done(1, 1, "Ready")
-            result = describe_source(args.source)
-        else:
-            parser.print_help()
-            return
-
+        total_steps, ready_message, run = COMMAND_HANDLERS[args.command]
+        output.step_done(1, total_steps, ready_message)
+        result = run(args, save)
     except Exception as e:
         output.warn(f"Error: {e}")
         result = {'error': str(e)}
@@ -1413,11 +1828,11 @@ Examples:
     output.print_summary(result)
 
     # Clean result for JSON output (remove DataFrame)
-    if result and 'dataframe' in result:
-        del result['dataframe']
+    if result:
+        result.pop('dataframe', None)
 
     # Print JSON result
-    print(json.dumps(result, indent=2, default=str))
+    print(_dumps_indented(result))
 
 
 if __name__ == '__main__':
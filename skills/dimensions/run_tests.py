@@ -7,9 +7,11 @@ Usage:
     python run_tests.py -v           # Verbose output
     python run_tests.py -k validation # Run only validation tests
     python run_tests.py --quick      # Run only unit tests (no API calls)
+
+Integration tests run in parallel (-n auto) when pytest-xdist is installed.
 """
 
-import subprocess
+import importlib.util
 import sys
 import os
 
@@ -23,23 +25,29 @@ def run_tests():
     args = sys.argv[1:]
 
     # Check for --quick flag
-    if '--quick' in args:
+    quick = '--quick' in args
+    if quick:
         args.remove('--quick')
         args.extend(['-k', 'not integration'])
 
+    # API-bound integration tests are independent: spread them over workers if xdist is available
+    # (tests sharing files are pinned to one worker with @pytest.mark.xdist_group)
+    if not quick and '-n' not in args and importlib.util.find_spec('xdist') is not None:
+        args.extend(['-n', 'auto', '--dist', 'loadgroup'])
+
     # Default to verbose if not specified
     if '-v' not in args and '--verbose' not in args:
         args.append('-v')
 
-    # Run pytest
-    cmd = [sys.executable, '-m', 'pytest', 'tests/'] + args
+    # Run pytest in this interpreter rather than spawning a new one
+    import pytest
+    pytest_args = ['tests/'] + args
 
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: pytest {' '.join(pytest_args)}")
     print(f"Working directory: {SKILL_DIR}")
     print("-" * 60)
 
-    result = subprocess.run(cmd)
-    return result.returncode
+    return int(pytest.main(pytest_args))
 
 
 if __name__ == '__main__':
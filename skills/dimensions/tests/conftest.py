@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the Dimensions skill tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even when pytest-xdist is not installed
+    config.addinivalue_line('markers', 'xdist_group(name): run these tests on the same xdist worker')
+
+
+def pytest_addoption(parser):
+    parser.addoption('--subprocess', action='store_true', default=False,
+                     help='Run integration commands in a fresh interpreter (smoke test of the installed script)')
+
+
+@pytest.fixture(scope='session')
+def helper():
+    """The dimensions_helper module, imported once for the whole session."""
+    import dimensions_helper
+    return dimensions_helper
+
+
+@pytest.fixture(scope='session')
+def dimcli_client(helper):
+    """Log in to the Dimensions API once per session; every in-process command reuses this client."""
+    return helper._get_client()
@@ -14,8 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dimensions_helper import (
     validate_facet,
     validate_aggregation_metrics,
-    _fetch_source_metadata,
-    _valid_fields_cache,
+    _source_schema,
 )
 
 
@@ -102,23 +101,27 @@ class TestMetadataFetching:
     """Tests for dynamic metadata fetching from API."""
 
     def test_fetch_metadata_populates_cache(self):
-        """_fetch_source_metadata should populate the cache."""
-        _fetch_source_metadata('publications')
-        assert 'publications' in _valid_fields_cache['facets']
-        assert 'publications' in _valid_fields_cache['metrics']
+        """_source_schema should cache the parsed schema."""
+        schema = _source_schema('publications')
+        assert _source_schema('publications') is schema
+        assert schema.facets
+        assert schema.metrics
 
     def test_fetched_facets_contains_year(self):
         """Fetched facets should contain year for publications."""
-        _fetch_source_metadata('publications')
-        facets = _valid_fields_cache['facets'].get('publications', set())
+        facets = _source_schema('publications').facets
         assert 'year' in facets
 
     def test_fetched_metrics_contains_count(self):
         """Fetched metrics should contain count."""
-        _fetch_source_metadata('publications')
-        metrics = _valid_fields_cache['metrics'].get('publications', set())
+        metrics = _source_schema('publications').metrics
         assert 'count' in metrics
 
+    def test_facet_prefix_index(self):
+        """Facet prefix index should group facets by their first '_' segment."""
+        schema = _source_schema('grants')
+        assert 'funder_org_acronym' in schema.facet_prefixes.get('funder', ())
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -13,24 +13,72 @@ Example:
                        for idx, item in enumerate(items)}
             for future in as_completed(futures):
                 future.result()
-                tracker.refresh()
 
     tracker.print_summary()
+
+The live display redraws itself refresh_rate times per second from the tracker's
+current state; workers only call the set_*/update_progress methods.
 """
 
+import functools
+import heapq
+import itertools
+import operator
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import IntEnum
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Callable, List, Any, Optional, Tuple, Generator
 from contextlib import contextmanager
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, RenderResult
 from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
 
+class Status(IntEnum):
+    """Item status, in display order; a failed item's error is kept in item_error."""
+    EXISTING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
+# Every possible progress bar, indexed by the number of filled cells
+_BAR_WIDTH = 22
+_BARS = tuple("[green]" + "█" * filled + "[/green]" + "░" * (_BAR_WIDTH - filled)
+              for filled in range(_BAR_WIDTH + 1))
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_size(b: int) -> str:
+    """Format a byte count for display (B, KB or MB)."""
+    if b < 1024:
+        return f"{b} B"
+    elif b < 1024 * 1024:
+        return f"{b/1024:.0f} KB"
+    else:
+        return f"{b/(1024*1024):.1f} MB"
+
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """Consistent copy of a tracker's state, taken under its lock once per render."""
+    counts: dict     # Status -> number of items
+    buckets: dict    # Status -> list of (item_id, index), for statuses not in `formatted`
+    active: list     # (item_id, (current, total), index) for processing items
+    versions: dict   # Status -> change counter, for reusing formatted item lists
+    formatted: dict  # Status -> formatted item list still current from an earlier render
+
+    @property
+    def processed(self) -> int:
+        """Items that are done (existing + completed + failed)."""
+        return self.counts[Status.EXISTING] + self.counts[Status.COMPLETED] + self.counts[Status.FAILED]
+
+
 class RichProgressTracker:
     """Thread-safe progress tracker with rich live display."""
 
@@ -54,6 +102,13 @@ class RichProgressTracker:
         """
         self.total_items = total_items
         self.operation_name = operation_name
+
+        # Display strings that only depend on operation_name and total_items
+        self._status_title = f"{operation_name} Status"
+        self._active_title = f"Active {operation_name}s"
+        self._progress_header = f"[bold]{operation_name} Progress[/bold] - "
+        self._processed_suffix = f"/{total_items} processed"
+        self._no_active_msg = f"[dim]No active {operation_name.lower()}s[/dim]"
         self.refresh_rate = refresh_rate
 
         # Category names (customizable)
@@ -64,210 +119,315 @@ class RichProgressTracker:
             "failed": "Failed"
         }
 
-        # Thread-safe tracking
+        # Thread-safe tracking: the lock guards status transitions and snapshots;
+        # update_progress writes item_progress without it (a single dict store)
         self.lock = threading.Lock()
-        self.item_status = {}      # item_id -> status
+        self.item_status = {}      # item_id -> Status
+        self.item_error = {}       # item_id -> error (first 50 chars), for failed items
         self.item_progress = {}    # item_id -> (current, total)
         self.item_index = {}       # item_id -> index (1-based)
+        self._idx_str = {}         # item_id -> "index/total", set with the index
+        self._display_name = {}    # item_id -> name truncated for the progress table
         self.failed_items = []     # List of (item_id, error_message)
 
+        # Per-status counts and members, kept in step with item_status by _set_status
+        # so counting and rendering never scan every item
+        self._counts = {status: 0 for status in Status}
+        self._buckets = {status: {} for status in Status}  # item_id -> index
+        self._versions = {status: 0 for status in Status}  # Bumped on bucket changes
+        self._formatted = {}  # Status -> (version, formatted "up to 5" item list)
+
         # Timing
-        self.start_time = None
+        self.start_time = None  # time.monotonic() when live_display started
 
-        # Console
+        # Console; the live display keeps its last-built tables until something changes
         self.console = Console()
         self._live = None
+        self._status_table = None
+        self._progress_table = None
+
+        # Set by every update; the live display only refills its tables when it is set
+        self._dirty = True
+        self._snapshot = None      # Snapshot the live tables were last filled from
+        self._last_render = 0.0    # time.monotonic() of that fill
+
+    def _set_status(self, item_id: str, status: Status):
+        """Record an item's status and move it between status buckets (caller holds the lock)."""
+        previous = self.item_status.get(item_id)
+        if previous is not None:
+            self._counts[previous] -= 1
+            del self._buckets[previous][item_id]
+            self._versions[previous] += 1
+            if previous == Status.FAILED:
+                self.item_error.pop(item_id, None)
+        self.item_status[item_id] = status
+        self._counts[status] += 1
+        self._buckets[status][item_id] = self.item_index.get(item_id, 0)
+        self._versions[status] += 1
+        self._dirty = True
+        if status != Status.PROCESSING:
+            # Progress and progress-table labels are only read for processing items
+            self.item_progress.pop(item_id, None)
+            self._idx_str.pop(item_id, None)
+            self._display_name.pop(item_id, None)
 
     def set_index(self, item_id: str, index: int):
         """Set the index for an item."""
         with self.lock:
             self.item_index[item_id] = index
+            self._idx_str[item_id] = f"{index}/{self.total_items}"
+            self._display_name[item_id] = item_id[:18] + ".." if len(item_id) > 20 else item_id
+            status = self.item_status.get(item_id)
+            if status is not None:
+                self._buckets[status][item_id] = index
+                self._versions[status] += 1
+                self._dirty = True
 
     def set_existing(self, item_id: str):
         """Mark item as already existing (skipped)."""
         with self.lock:
-            self.item_status[item_id] = "existing"
+            self._set_status(item_id, Status.EXISTING)
 
     def set_processing(self, item_id: str):
         """Mark item as currently processing."""
         with self.lock:
-            self.item_status[item_id] = "processing"
+            self._set_status(item_id, Status.PROCESSING)
             self.item_progress[item_id] = (0, 0)
 
     def update_progress(self, item_id: str, current: int, total: int):
         """Update progress for an item."""
-        with self.lock:
-            self.item_progress[item_id] = (current, total)
+        self.item_progress[item_id] = (current, total)
+        self._dirty = True
 
     def set_completed(self, item_id: str):
         """Mark item as completed."""
         with self.lock:
-            self.item_status[item_id] = "completed"
+            self._set_status(item_id, Status.COMPLETED)
 
     def set_failed(self, item_id: str, error: str = ""):
         """Mark item as failed."""
+        error = str(error)
         with self.lock:
-            self.item_status[item_id] = f"failed: {str(error)[:50]}"
-            self.failed_items.append((item_id, str(error)))
+            self._set_status(item_id, Status.FAILED)
+            self.item_error[item_id] = error[:50]
+        # list.append is atomic, so the failure log needs no lock
+        self.failed_items.append((item_id, error))
 
+    # Counters are plain ints updated under the lock; reading one needs no lock
     @property
     def existing_count(self) -> int:
-        with self.lock:
-            return len([v for v in self.item_status.values() if v == "existing"])
+        return self._counts[Status.EXISTING]
 
     @property
     def processing_count(self) -> int:
-        with self.lock:
-            return len([v for v in self.item_status.values() if v == "processing"])
+        return self._counts[Status.PROCESSING]
 
     @property
     def completed_count(self) -> int:
-        with self.lock:
-            return len([v for v in self.item_status.values() if v == "completed"])
+        return self._counts[Status.COMPLETED]
 
     @property
     def failed_count(self) -> int:
-        with self.lock:
-            return len([v for v in self.item_status.values() if v.startswith("failed")])
+        return self._counts[Status.FAILED]
 
     @property
     def processed_count(self) -> int:
         """Items that are done (existing + completed + failed)."""
-        return self.existing_count + self.completed_count + self.failed_count
+        counts = self._copy_counts()
+        return counts[Status.EXISTING] + counts[Status.COMPLETED] + counts[Status.FAILED]
 
-    def _create_status_table(self) -> Table:
-        """Create the status summary table."""
-        table = Table(title=f"{self.operation_name} Status", box=box.ROUNDED, expand=True)
+    def _copy_counts(self) -> dict:
+        """Copy all status counts under one lock hold, so they add up consistently."""
+        with self.lock:
+            return dict(self._counts)
+
+    def snapshot(self) -> ProgressSnapshot:
+        """
+        Copy counters, category members and active progress under a single lock hold.
+        Buckets whose formatted item list is still current are not copied, which keeps
+        the hold short when a large bucket (usually completed) has not changed.
+        """
+        with self.lock:
+            progress = self.item_progress
+            versions = dict(self._versions)
+            buckets, formatted = {}, {}
+            for status, bucket in self._buckets.items():
+                cached = self._formatted.get(status)
+                if cached is not None and cached[0] == versions[status]:
+                    formatted[status] = cached[1]
+                else:
+                    buckets[status] = list(bucket.items())
+            return ProgressSnapshot(
+                counts=dict(self._counts),
+                buckets=buckets,
+                active=[(k, progress.get(k, (0, 0)), idx) for k, idx in self._buckets[Status.PROCESSING].items()],
+                versions=versions,
+                formatted=formatted,
+            )
+
+    def _new_status_table(self) -> Table:
+        """Create an empty status summary table."""
+        table = Table(title=self._status_title, box=box.ROUNDED, expand=True)
         table.add_column("Category", style="cyan", width=12)
         table.add_column("Count", style="magenta", justify="right", width=14)
         table.add_column("Items (up to 5)", style="dim", overflow="fold")
+        return table
 
-        with self.lock:
-            existing = [(k, self.item_index.get(k, 0)) for k, v in self.item_status.items() if v == "existing"]
-            processing = [(k, self.item_index.get(k, 0)) for k, v in self.item_status.items() if v == "processing"]
-            completed = [(k, self.item_index.get(k, 0)) for k, v in self.item_status.items() if v == "completed"]
-            failed = [(k, self.item_index.get(k, 0)) for k, v in self.item_status.items() if v.startswith("failed")]
+    def _create_status_table(self, snapshot: ProgressSnapshot) -> Table:
+        """Create the status summary table."""
+        table = self._new_status_table()
+
+        counts = snapshot.counts
 
-        def format_items(item_list, limit=5, reverse=False):
+        def format_items(status, limit=5, reverse=False):
+            if status in snapshot.formatted:
+                return snapshot.formatted[status]
+            item_list = snapshot.buckets[status]
             if not item_list:
-                return "-"
-            sorted_items = sorted(item_list, key=lambda x: -x[1] if reverse else x[1])[:limit]
-            formatted = [f"{i[0][:15]}.. ({i[1]}/{self.total_items})" if len(i[0]) > 17
-                        else f"{i[0]} ({i[1]}/{self.total_items})" for i in sorted_items]
-            suffix = "..." if len(item_list) > limit else ""
-            return ", ".join(formatted) + suffix
+                text = "-"
+            else:
+                pick = heapq.nlargest if reverse else heapq.nsmallest  # Top `limit` without a full sort
+                sorted_items = pick(limit, item_list, key=operator.itemgetter(1))
+                formatted = [f"{i[0][:15]}.. ({i[1]}/{self.total_items})" if len(i[0]) > 17
+                            else f"{i[0]} ({i[1]}/{self.total_items})" for i in sorted_items]
+                suffix = "..." if len(item_list) > limit else ""
+                text = ", ".join(formatted) + suffix
+            self._formatted[status] = (snapshot.versions[status], text)
+            return text
 
         table.add_row(f"[yellow]{self.categories['existing']}[/yellow]",
-                      f"{len(existing)}/{self.total_items}", format_items(existing))
+                      f"{counts[Status.EXISTING]}/{self.total_items}", format_items(Status.EXISTING))
         table.add_row(f"[blue]{self.categories['processing']}[/blue]",
-                      f"{len(processing)}/{self.total_items}", format_items(processing))
+                      f"{counts[Status.PROCESSING]}/{self.total_items}", format_items(Status.PROCESSING))
         table.add_row(f"[green]{self.categories['completed']}[/green]",
-                      f"{len(completed)}/{self.total_items}", format_items(completed, reverse=True))
+                      f"{counts[Status.COMPLETED]}/{self.total_items}", format_items(Status.COMPLETED, reverse=True))
         table.add_row(f"[red]{self.categories['failed']}[/red]",
-                      f"{len(failed)}/{self.total_items}", format_items(failed))
+                      f"{counts[Status.FAILED]}/{self.total_items}", format_items(Status.FAILED))
 
         return table
 
-    def _create_progress_table(self) -> Table:
-        """Create the active operations progress table."""
-        table = Table(title=f"Active {self.operation_name}s", box=box.SIMPLE, expand=True)
+    def _new_progress_table(self) -> Table:
+        """Create an empty active operations progress table."""
+        table = Table(title=self._active_title, box=box.SIMPLE, expand=True)
         table.add_column("#", style="white bold", width=12, justify="right")
         table.add_column("Item", style="cyan", width=20)
         table.add_column("Progress", width=32)
         table.add_column("Current", style="green", justify="right", width=10)
         table.add_column("Total", style="blue", justify="right", width=10)
+        return table
 
-        with self.lock:
-            active = [(k, v, self.item_index.get(k, 0)) for k, v in self.item_progress.items()
-                      if self.item_status.get(k) == "processing"]
+    def _create_progress_table(self, snapshot: ProgressSnapshot) -> Table:
+        """Create the active operations progress table."""
+        table = self._new_progress_table()
 
-        active = sorted(active, key=lambda x: x[2])
+        active = sorted(snapshot.active, key=lambda x: x[2])
 
         for item_id, (current, total), idx in active:
-            idx_str = f"{idx}/{self.total_items}"
-            item_display = item_id[:18] + ".." if len(item_id) > 20 else item_id
+            idx_str = self._idx_str.get(item_id) or f"{idx}/{self.total_items}"
+            item_display = self._display_name.get(item_id)
+            if item_display is None:  # No set_index call for this item
+                item_display = item_id[:18] + ".." if len(item_id) > 20 else item_id
 
             if total > 0:
                 pct = current / total
-                bar_width = 22
-                filled = int(bar_width * pct)
-                bar = "[green]" + "█" * filled + "[/green]" + "░" * (bar_width - filled)
+                bar = _BARS[min(max(int(_BAR_WIDTH * pct), 0), _BAR_WIDTH)]
                 pct_str = f"{pct*100:.1f}%"
             else:
                 bar = "[dim]Starting...[/dim]"
                 pct_str = ""
 
-            # Auto-format sizes
-            def fmt_size(b):
-                if b < 1024:
-                    return f"{b} B"
-                elif b < 1024 * 1024:
-                    return f"{b/1024:.0f} KB"
-                else:
-                    return f"{b/(1024*1024):.1f} MB"
-
-            current_str = fmt_size(current)
-            total_str = fmt_size(total) if total > 0 else "?"
+            current_str = _fmt_size(current)
+            total_str = _fmt_size(total) if total > 0 else "?"
 
             table.add_row(idx_str, item_display, f"{bar} {pct_str}", current_str, total_str)
 
         if not active:
-            table.add_row("-", f"[dim]No active {self.operation_name.lower()}s[/dim]", "", "", "")
+            table.add_row("-", self._no_active_msg, "", "", "")
 
         return table
 
-    def create_display(self) -> Table:
-        """Create the full dashboard display."""
-        layout = Table.grid(expand=True)
-
-        # Header
-        processed = self.processed_count
-        header = f"[bold]{self.operation_name} Progress[/bold] - {processed}/{self.total_items} processed"
+    def _create_header(self, snapshot: ProgressSnapshot) -> Panel:
+        """Create the header panel with processed count, elapsed time and ETA."""
+        processed = snapshot.processed
+        header = f"{self._progress_header}{processed}{self._processed_suffix}"
 
-        if self.start_time:
-            elapsed = time.time() - self.start_time
+        if self.start_time is not None:
+            elapsed = time.monotonic() - self.start_time
             header += f" | Elapsed: {elapsed:.0f}s"
             if processed > 0:
                 rate = processed / elapsed
                 remaining = (self.total_items - processed) / rate if rate > 0 else 0
                 header += f" | ETA: {remaining:.0f}s"
 
-        layout.add_row(Panel(header, style="blue"))
-        layout.add_row(self._create_status_table())
-        layout.add_row(self._create_progress_table())
+        return Panel(header, style="blue")
+
+    def create_display(self) -> Table:
+        """Create the full dashboard display."""
+        layout = Table.grid(expand=True)
+        snapshot = self.snapshot()
+
+        layout.add_row(self._create_header(snapshot))
+        layout.add_row(self._create_status_table(snapshot))
+        layout.add_row(self._create_progress_table(snapshot))
 
         return layout
 
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        """
+        Render the current state; Live calls this on each of its timed refreshes.
+        The two tables are rebuilt only when something changed since the last render.
+        """
+        if self._dirty or self._snapshot is None:
+            self._dirty = False  # Cleared first so updates made during the snapshot are not lost
+            self._snapshot = self.snapshot()
+            self._last_render = time.monotonic()
+            self._status_table = self._create_status_table(self._snapshot)
+            self._progress_table = self._create_progress_table(self._snapshot)
+
+        yield self._create_header(self._snapshot)  # Elapsed time and ETA move on regardless
+        yield self._status_table
+        yield self._progress_table
+
     def refresh(self):
-        """Refresh the live display."""
-        if self._live:
-            self._live.update(self.create_display())
+        """
+        Redraw the live display now instead of waiting for the next timed refresh.
+        Calls with nothing new, or within 1/refresh_rate of the last redraw, are skipped.
+        """
+        if (self._live and self._dirty
+                and time.monotonic() - self._last_render >= 1 / self.refresh_rate):
+            self._live.refresh()
 
     @contextmanager
     def live_display(self):
-        """Context manager for live display."""
-        self.start_time = time.time()
-        with Live(self.create_display(), console=self.console,
-                  refresh_per_second=self.refresh_rate) as live:
+        """
+        Context manager for live display.
+        Rich's refresh thread redraws the tracker refresh_rate times per second,
+        so rendering never runs on the worker or completion threads.
+        """
+        self.start_time = time.monotonic()
+        with Live(self, console=self.console, refresh_per_second=self.refresh_rate) as live:
             self._live = live
             yield live
-            live.update(self.create_display())
         self._live = None
 
     def print_summary(self):
         """Print final summary after processing."""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = time.monotonic() - self.start_time if self.start_time is not None else 0
+        counts = self._copy_counts()
+
+        total_fmt = f"{self.total_items:,}"
+        lines = [
+            f"[bold]{self.operation_name} Complete[/bold]",
+            f"Time elapsed: {elapsed:.1f}s ({elapsed/60:.1f} min)",
+            "",
+            "[bold]Results:[/bold]",
+            f"  [yellow]{self.categories['existing']}:[/yellow]  {counts[Status.EXISTING]:>10,}/{total_fmt}",
+            f"  [green]{self.categories['completed']}:[/green] {counts[Status.COMPLETED]:>10,}/{total_fmt}",
+            f"  [red]{self.categories['failed']}:[/red]     {counts[Status.FAILED]:>10,}/{total_fmt}",
+        ]
 
         self.console.print("\n")
-        self.console.print(Panel.fit(
-            f"[bold]{self.operation_name} Complete[/bold]\n"
-            f"Time elapsed: {elapsed:.1f}s ({elapsed/60:.1f} min)\n\n"
-            f"[bold]Results:[/bold]\n"
-            f"  [yellow]{self.categories['existing']}:[/yellow]  {self.existing_count:>10,}/{self.total_items:,}\n"
-            f"  [green]{self.categories['completed']}:[/green] {self.completed_count:>10,}/{self.total_items:,}\n"
-            f"  [red]{self.categories['failed']}:[/red]     {self.failed_count:>10,}/{self.total_items:,}",
-            title="Summary", border_style="blue"
-        ))
+        self.console.print(Panel.fit("\n".join(lines), title="Summary", border_style="blue"))
 
         if self.failed_items:
             self.console.print(f"\n[red bold]Failed items ({len(self.failed_items)}):[/red bold]")
@@ -329,16 +489,25 @@ def create_parallel_processor(
 
     with tracker.live_display():
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(process_func, item, idx + 1, tracker): item
-                for idx, item in enumerate(items)
-            }
-
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception:
-                    pass
+            # Keep at most max_workers * 2 tasks submitted, so memory does not grow with len(items)
+            work = enumerate(items, start=1)
+            max_pending = max_workers * 2
+            pending = set()
+
+            while True:
+                for idx, item in itertools.islice(work, max_pending - len(pending)):
+                    pending.add(executor.submit(process_func, item, idx, tracker))
+                if not pending:
+                    break
+
+                # Handle every future that finished since the last wake-up as one batch,
+                # with one (throttled) redraw per batch instead of one per future
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
                 tracker.refresh()
 
     tracker.print_summary()
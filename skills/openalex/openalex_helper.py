@@ -12,62 +12,192 @@ Output formats:
   - csv: Universal compatibility (legacy)
 
 Output location: /tmp/openalex-results/ (default), or specify with --output-dir
+
+Parquet engine: pyarrow by default (zstd). Set OPENALEX_PARQUET_ENGINE=fastparquet
+to write with fastparquet instead, which can be faster on some flat frames but
+is slower to import and stores nested lists/dicts less faithfully. When pyarrow
+rejects a frame, fastparquet (if installed) is tried before nested values are
+serialized to JSON strings. Streamed cursor saves always use pyarrow.
 """
 
 import sys
 import json
+import functools
 import argparse
 import os
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlencode
 
+import numpy as np
 import requests
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: much faster JSON encoding for JSONL output
+except ImportError:
+    orjson = None
+
+try:
+    import fastparquet  # Optional: alternate parquet engine (see OPENALEX_PARQUET_ENGINE)
+except ImportError:
+    fastparquet = None
+
+try:
+    import httpx  # Optional: HTTP/2 client for API GETs (needs the h2 package)
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+# orjson options matching json.dumps(default=str) behaviour for API payloads
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+# Stdlib fallback: one compact encoder reused for every record (API payloads are never circular)
+_json_encode = json.JSONEncoder(default=str, ensure_ascii=False, check_circular=False,
+                                separators=(',', ':')).encode
+
+# Parse response bodies straight from bytes (orjson when available)
+_json_loads = orjson.loads if orjson else json.loads
 
 # API Configuration
 BASE_URL = "https://api.openalex.org"
 EMAIL = os.environ.get("OPENALEX_EMAIL", "user@example.com")  # For polite pool
 
+# Retry policy shared by both HTTP clients
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+
+# Shared HTTP session so every request reuses pooled keep-alive connections
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=32,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES),
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+_SESSION.headers.update({
+    'User-Agent': f'openalex-helper (mailto:{EMAIL})',
+    'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br/zstd when their decoders are installed
+})
+
+# With httpx + h2 installed, api_request GETs share one multiplexed HTTP/2 connection
+_HTTPX = httpx.Client(
+    http2=True,
+    headers={'User-Agent': _SESSION.headers['User-Agent']},
+    timeout=60.0,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,  # connection errors only; status retries are in _httpx_get
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=32),
+    ),
+) if httpx else None
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
 # Cache for valid fields (fetched dynamically from API)
 _valid_fields_cache = {
     'group_by': {},  # entity_type -> set of valid fields
     'select': {},    # entity_type -> set of valid fields
 }
 
+# On-disk valid-field cache shared across CLI runs (set OPENALEX_FIELD_CACHE_TTL=0 to disable)
+FIELD_CACHE_PATH = Path.home() / ".cache" / "openalex" / "valid_fields.json"
+FIELD_CACHE_TTL = int(os.environ.get('OPENALEX_FIELD_CACHE_TTL', 7 * 86400))  # seconds
+FIELD_CACHE_REFRESH = False  # set by --refresh-field-cache to ignore stored entries
+_field_cache_file = None  # parsed FIELD_CACHE_PATH, read at most once per process for lookups
+
+
+def _field_set(names):
+    """Build a read-only field set; names are interned since the same identifiers recur in every lookup."""
+    return frozenset(sys.intern(name.strip()) for name in names if name.strip())
+
+
+def _read_field_cache(reload=False):
+    """Return the on-disk field cache as {kind: {entity_type: {'fields', 'ts'}}}."""
+    global _field_cache_file
+    if _field_cache_file is None or reload:
+        try:
+            with open(FIELD_CACHE_PATH) as f:
+                _field_cache_file = json.load(f)
+        except (OSError, ValueError):
+            _field_cache_file = {}
+    return _field_cache_file
+
+
+def _load_cached_fields(kind, entity_type):
+    """Return the cached field set for (kind, entity_type) if it is within the TTL."""
+    if FIELD_CACHE_TTL <= 0 or FIELD_CACHE_REFRESH:
+        return None
+    entry = _read_field_cache().get(kind, {}).get(entity_type)
+    # Wall-clock time on purpose: 'ts' is compared across processes, where monotonic clocks don't carry over
+    if not entry or time.time() - entry.get('ts', 0) > FIELD_CACHE_TTL:
+        return None
+    fields = _field_set(entry.get('fields', []))
+    if fields:
+        _valid_fields_cache[kind][entity_type] = fields
+        return fields
+    return None
+
+
+def _save_cached_fields(kind, entity_type, fields):
+    """Persist a field set to the on-disk cache (atomic, best effort)."""
+    if FIELD_CACHE_TTL <= 0:
+        return
+    # Re-read so entries written by concurrent runs since our lookup are kept
+    cache = _read_field_cache(reload=True)
+    cache.setdefault(kind, {})[entity_type] = {'fields': sorted(fields), 'ts': time.time()}
+    tmp_path = FIELD_CACHE_PATH.with_name(f"{FIELD_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        FIELD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, FIELD_CACHE_PATH)
+    except OSError:
+        pass
+
 
 def _fetch_valid_group_by_fields(entity_type):
     """Fetch valid group_by fields from the API by parsing error messages."""
     if entity_type in _valid_fields_cache['group_by']:
         return _valid_fields_cache['group_by'][entity_type]
 
+    cached = _load_cached_fields('group_by', entity_type)
+    if cached is not None:
+        return cached
+
     try:
         # Make a request with an invalid field to get the list of valid fields
         params = {'group_by': '__invalid_field_to_get_valid_list__', 'per_page': 1}
         params['mailto'] = EMAIL
         url = f"{BASE_URL}/{entity_type}"
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
 
         if response.status_code == 400:
-            error_data = response.json()
+            error_data = _json_loads(response.content)
             message = error_data.get('message', '')
             # Parse valid fields from error message
             if 'Valid fields are' in message:
                 fields_part = message.split('Valid fields are')[1]
                 # Extract field names (they list underscore/hyphenated versions)
                 fields_str = fields_part.strip().rstrip('.')
-                valid_fields = set()
-                for field in fields_str.split(', '):
-                    field = field.strip()
-                    if field:
-                        valid_fields.add(field)
+                valid_fields = _field_set(fields_str.split(', '))
                 _valid_fields_cache['group_by'][entity_type] = valid_fields
+                _save_cached_fields('group_by', entity_type, valid_fields)
                 return valid_fields
     except Exception as e:
         print(f"Warning: Could not fetch valid group_by fields: {e}", file=sys.stderr)
 
-    return set()  # Return empty set if we can't fetch
+    return frozenset()  # Return empty set if we can't fetch
 
 
 def _fetch_valid_select_fields(entity_type):
@@ -75,31 +205,65 @@ def _fetch_valid_select_fields(entity_type):
     if entity_type in _valid_fields_cache['select']:
         return _valid_fields_cache['select'][entity_type]
 
+    cached = _load_cached_fields('select', entity_type)
+    if cached is not None:
+        return cached
+
     try:
         # Make a request with an invalid select field to get the list of valid fields
         params = {'select': '__invalid_field__', 'per_page': 1}
         params['mailto'] = EMAIL
         url = f"{BASE_URL}/{entity_type}"
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
 
         if response.status_code == 400:
-            error_data = response.json()
+            error_data = _json_loads(response.content)
             message = error_data.get('message', '')
             # Parse valid fields from error message
             if 'Valid fields for select are' in message:
                 fields_part = message.split('Valid fields for select are:')[1]
                 fields_str = fields_part.strip().rstrip('.')
-                valid_fields = set()
-                for field in fields_str.split(', '):
-                    field = field.strip()
-                    if field:
-                        valid_fields.add(field)
+                valid_fields = _field_set(fields_str.split(', '))
                 _valid_fields_cache['select'][entity_type] = valid_fields
+                _save_cached_fields('select', entity_type, valid_fields)
                 return valid_fields
     except Exception as e:
         print(f"Warning: Could not fetch valid select fields: {e}", file=sys.stderr)
 
-    return set()  # Return empty set if we can't fetch
+    return frozenset()  # Return empty set if we can't fetch
+
+
+@functools.lru_cache(maxsize=256)
+def _group_by_error(entity_type, group_field):
+    """Return the error message for an invalid group_by field, or None if it is valid."""
+    valid_fields = _fetch_valid_group_by_fields(entity_type)
+    if group_field in valid_fields:
+        return None
+
+    # Find similar fields for suggestions
+    field_base = group_field.split('.')[0]
+    suggestions = [f for f in valid_fields if field_base in f][:5]
+
+    error_msg = f"Invalid group_by field '{group_field}' for {entity_type}.\n"
+    if suggestions:
+        error_msg += f"Similar valid fields: {', '.join(suggestions)}\n"
+    error_msg += f"See https://docs.openalex.org/how-to-use-the-api/get-groups-of-entities for all valid fields."
+    return error_msg
+
+
+@functools.lru_cache(maxsize=256)
+def _select_error(entity_type, fields):
+    """Return the error message for a tuple of select fields, or None if all are valid."""
+    valid_fields = _fetch_valid_select_fields(entity_type)
+    # Common case: every field is valid, checked in C without building a list
+    if valid_fields.issuperset(filter(None, fields)):
+        return None
+    invalid_fields = [field for field in fields if field and field not in valid_fields]
+
+    error_msg = f"Invalid select field(s) for {entity_type}: {', '.join(invalid_fields)}\n"
+    error_msg += f"Valid fields: {', '.join(sorted(valid_fields)[:20])}...\n"
+    error_msg += "Tip: Complex nested objects like 'grants' cannot be selected. Fetch full records instead."
+    return error_msg
 
 
 def validate_group_by_field(entity_type, group_field):
@@ -107,21 +271,13 @@ def validate_group_by_field(entity_type, group_field):
     Validate that the group_by field is supported by the API.
     Fetches valid fields dynamically from the API.
     """
-    valid_fields = _fetch_valid_group_by_fields(entity_type)
-
-    if not valid_fields:
+    if not _fetch_valid_group_by_fields(entity_type):
         # If we couldn't fetch valid fields, let the API handle validation
         return
 
-    if group_field not in valid_fields:
-        # Find similar fields for suggestions
-        field_base = group_field.split('.')[0]
-        suggestions = [f for f in valid_fields if field_base in f][:5]
-
-        error_msg = f"Invalid group_by field '{group_field}' for {entity_type}.\n"
-        if suggestions:
-            error_msg += f"Similar valid fields: {', '.join(suggestions)}\n"
-        error_msg += f"See https://docs.openalex.org/how-to-use-the-api/get-groups-of-entities for all valid fields."
+    # Verdicts are memoized; the message is re-raised on every call
+    error_msg = _group_by_error(entity_type, group_field)
+    if error_msg:
         raise ValueError(error_msg)
 
 
@@ -133,23 +289,13 @@ def validate_select_fields(entity_type, select_str):
     if not select_str:
         return
 
-    valid_fields = _fetch_valid_select_fields(entity_type)
-
-    if not valid_fields:
+    if not _fetch_valid_select_fields(entity_type):
         # If we couldn't fetch valid fields, let the API handle validation
         return
 
-    fields = [f.strip() for f in select_str.split(',')]
-    invalid_fields = []
-
-    for field in fields:
-        if field and field not in valid_fields:
-            invalid_fields.append(field)
-
-    if invalid_fields:
-        error_msg = f"Invalid select field(s) for {entity_type}: {', '.join(invalid_fields)}\n"
-        error_msg += f"Valid fields: {', '.join(sorted(valid_fields)[:20])}...\n"
-        error_msg += "Tip: Complex nested objects like 'grants' cannot be selected. Fetch full records instead."
+    # Verdicts are memoized; the message is re-raised on every call
+    error_msg = _select_error(entity_type, tuple(f.strip() for f in select_str.split(',')))
+    if error_msg:
         raise ValueError(error_msg)
 
 # Default output directory
@@ -158,19 +304,61 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 # Default format: dual (parquet + jsonl)
 DEFAULT_FORMAT = 'dual'
+FORMAT_CHOICES = ('dual', 'parquet', 'jsonl', 'tsv', 'csv')
+
+# CLI choices, shared by every subcommand that takes them (topics has no group_by/autocomplete)
+ENTITY_CHOICES = ('works', 'authors', 'institutions', 'sources', 'funders', 'topics')
+ENTITY_CHOICES_NO_TOPICS = ENTITY_CHOICES[:-1]
+SEARCH_FIELD_CHOICES = ('title', 'abstract', 'fulltext', 'title_and_abstract')
 
 # Rate limiting
-REQUESTS_PER_SECOND = 10
-last_request_time = 0
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Allows bursts of up to `capacity` requests and refills at `rate` tokens per
+    second, so only sustained overuse has to sleep. Refills are timed with
+    time.monotonic() so wall-clock adjustments can't stall or flood requests.
+    """
+
+    def __init__(self, capacity=10, rate=10.0):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n=1):
+        """Block until `n` tokens are available, then take them."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_bucket = TokenBucket(capacity=10, rate=10.0)
 
 
 def rate_limit():
     """Ensure we don't exceed rate limits."""
-    global last_request_time
-    elapsed = time.time() - last_request_time
-    if elapsed < 1.0 / REQUESTS_PER_SECOND:
-        time.sleep(1.0 / REQUESTS_PER_SECOND - elapsed)
-    last_request_time = time.time()
+    _bucket.acquire(1)
+
+
+def _httpx_get(url, params):
+    """GET through the HTTP/2 client, retrying throttled/5xx responses like the requests session."""
+    # Merge rather than replace: httpx would drop a query string already on the URL
+    url = httpx.URL(url).copy_merge_params(params)
+    for attempt in range(MAX_RETRIES + 1):
+        response = _HTTPX.get(url)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
 
 
 def api_request(endpoint, params=None):
@@ -186,10 +374,13 @@ def api_request(endpoint, params=None):
     url = f"{BASE_URL}/{endpoint}"
 
     try:
-        response = requests.get(url, params=params, timeout=60)
+        if _HTTPX is not None:
+            response = _httpx_get(url, params)
+        else:
+            response = _SESSION.get(url, params=params, timeout=60)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return _json_loads(response.content)
+    except _HTTP_ERRORS + (ValueError,) as e:
         print(f"API Error: {e}", file=sys.stderr)
         raise
 
@@ -205,62 +396,156 @@ def generate_filename(prefix, query_terms=None):
 
 
 def clean_for_parquet(df):
-    """Clean DataFrame for parquet export by ensuring consistent types per column."""
-    df_clean = df.copy()
+    """
+    Clean DataFrame for parquet export by ensuring consistent types per column.
 
-    for col in df_clean.columns:
-        if df_clean[col].dtype != 'object':
-            continue
+    Returns a new DataFrame that shares unchanged columns with `df` instead of
+    copying it; `df` itself is not modified.
+    """
+    object_cols = [col for col in df.columns if df[col].dtype == 'object']
+    if not object_cols:
+        return df  # Only typed columns: nothing to clean
 
-        non_null = df_clean[col].dropna()
-        if non_null.empty:
+    new_cols = {col: df[col] for col in df.columns}
+
+    for col in object_cols:
+        values = df[col]
+        non_null = values.notna().to_numpy()
+        if not non_null.any():
             continue
 
-        # Count type occurrences
-        type_counts = {'list': 0, 'dict': 0, 'primitive': 0}
-        for val in non_null:
-            if isinstance(val, list) and val:
-                type_counts['list'] += 1
-            elif isinstance(val, dict) and val:
-                type_counts['dict'] += 1
-            elif not isinstance(val, (list, dict)) and val != '':
-                type_counts['primitive'] += 1
+        cells = values.to_numpy()
+        if pd.api.types.infer_dtype(cells, skipna=True) not in ('mixed', 'mixed-integer'):
+            # No lists or dicts (a single C-level scan), so primitives win: only '' needs nulling
+            scalar = cells != ''
+            new_cols[col] = (values if scalar.all() else values.where(scalar, None)).infer_objects()
+            continue
 
+        # Classify every cell with array masks; empty lists/dicts and '' count toward no type.
+        # Exact type() matches are enough: parsed JSON never yields list/dict subclasses.
+        types = np.fromiter(map(type, cells), dtype=object, count=len(cells))
+        is_list = types == list
+        is_dict = types == dict
+        nested = is_list | is_dict
+        non_empty = np.zeros(len(cells), dtype=bool)
+        non_empty[nested] = np.fromiter(map(len, cells[nested]), dtype=np.int64, count=nested.sum()) > 0
+        is_list &= non_empty
+        is_dict &= non_empty
+        scalar = ~nested & (cells != '')
+
+        type_counts = {'list': is_list.sum(), 'dict': is_dict.sum(), 'primitive': (scalar & non_null).sum()}
         dominant_type = max(type_counts, key=type_counts.get)
         if type_counts[dominant_type] == 0:
             dominant_type = 'primitive'
 
-        def make_cleaner(dominant):
-            def clean_value(val):
-                if val is None:
-                    return None
-                if dominant == 'list':
-                    return val if isinstance(val, list) and val else None
-                elif dominant == 'dict':
-                    return val if isinstance(val, dict) and val else None
-                else:
-                    if isinstance(val, (list, dict)):
-                        return None
-                    if isinstance(val, str) and val == '':
-                        return None
-                    return val
-            return clean_value
+        # Null out every value that doesn't match the dominant type
+        keep = {'list': is_list, 'dict': is_dict, 'primitive': scalar}[dominant_type]
+        new_cols[col] = values.where(keep, None).infer_objects()
 
-        cleaner = make_cleaner(dominant_type)
-        df_clean[col] = df_clean[col].apply(cleaner)
+    return pd.DataFrame(new_cols, index=df.index, copy=False)
 
-    return df_clean
+
+def _dumps(obj):
+    """Serialize a nested value to a JSON string (uses orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+    return _json_encode(obj)
+
+
+def _print_result(result):
+    """
+    Write a result to stdout with a 2-space indent, without building an
+    intermediate str: orjson bytes go straight to the binary buffer, and the
+    stdlib fallback streams through json.dump.
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(result, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+        buffer.write(b'\n')
+        buffer.flush()
+        return
+    json.dump(result, sys.stdout, indent=2, default=str)
+    sys.stdout.write('\n')
 
 
 def serialize_for_text_format(df):
-    """Serialize nested structures to JSON strings for text formats."""
-    df_serialized = df.copy()
-    for col in df_serialized.columns:
-        if df_serialized[col].dtype == 'object':
-            df_serialized[col] = df_serialized[col].apply(
-                lambda x: json.dumps(x, default=str) if isinstance(x, (list, dict)) else x
-            )
-    return df_serialized
+    """Serialize nested structures to JSON strings for text formats (does not modify `df`)."""
+    new_cols = {col: df[col] for col in df.columns}
+    for col in df.columns:
+        if df[col].dtype != 'object':
+            continue
+
+        cells = df[col].to_numpy()
+        types = np.fromiter(map(type, cells), dtype=object, count=len(cells))
+        nested = (types == list) | (types == dict)
+        if not nested.any():
+            continue  # Only scalars: nothing to serialize
+
+        out = cells.copy()
+        out[nested] = np.fromiter(map(_dumps, cells[nested]), dtype=object, count=int(nested.sum()))
+        new_cols[col] = pd.Series(out, index=df.index, name=col)
+    return pd.DataFrame(new_cols, index=df.index, copy=False)
+
+
+def _write_jsonl_records(f, records):
+    """Write records as JSON lines to an open binary file (uses orjson when available)."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        f.writelines(orjson.dumps(record, default=str, option=option) for record in records)
+    else:
+        f.writelines((_json_encode(record) + '\n').encode('utf-8') for record in records)
+
+
+def _write_jsonl(path, records):
+    """Write records to a JSON Lines file (uses orjson when available, else the stdlib encoder)."""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        _write_jsonl_records(f, records)
+
+
+def _save_jsonl(path, df, raw_data=None):
+    """Save JSONL straight from the raw records when available, else from the DataFrame."""
+    if raw_data:
+        _write_jsonl(path, raw_data)
+    else:
+        df.to_json(path, orient='records', lines=True)
+
+
+# Parquet writer settings shared by one-shot and streamed saves
+PARQUET_WRITE_OPTIONS = {'compression': 'zstd', 'compression_level': 3}
+PARQUET_ENGINE = os.environ.get('OPENALEX_PARQUET_ENGINE', 'pyarrow')
+
+
+def _write_parquet(df, path, engine=None):
+    """Write a DataFrame to parquet with zstd compression (pyarrow unless PARQUET_ENGINE says otherwise)."""
+    if (engine or PARQUET_ENGINE) == 'fastparquet':
+        df.to_parquet(path, engine='fastparquet', compression='zstd', index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False, safe=False)
+    pq.write_table(table, path, **PARQUET_WRITE_OPTIONS)
+
+
+def _save_parquet(df, path):
+    """
+    Save the cleaned DataFrame as parquet. If the configured engine rejects it, try
+    fastparquet (when installed), then fall back to JSON-serialized nested columns.
+    """
+    df_clean = clean_for_parquet(df)
+    try:
+        _write_parquet(df_clean, path)
+        return
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        error = e
+
+    if fastparquet is not None and PARQUET_ENGINE != 'fastparquet':
+        try:
+            _write_parquet(df_clean, path, engine='fastparquet')
+            return
+        except (ValueError, TypeError) as e:
+            error = e
+
+    print(f"Native parquet failed ({error}), falling back to serialized format", file=sys.stderr)
+    _write_parquet(serialize_for_text_format(df), path)
 
 
 def save_results(df, prefix, query_terms=None, format=None, raw_data=None):
@@ -269,43 +554,25 @@ def save_results(df, prefix, query_terms=None, format=None, raw_data=None):
         format = DEFAULT_FORMAT
 
     filename = generate_filename(prefix, query_terms)
-    df_clean = clean_for_parquet(df)
 
     if format == 'dual':
         parquet_path = OUTPUT_DIR / f"{filename}.parquet"
         jsonl_path = OUTPUT_DIR / f"{filename}.jsonl"
 
-        try:
-            df_clean.to_parquet(parquet_path, index=False)
-        except Exception as e:
-            print(f"Native parquet failed ({e}), falling back to serialized format", file=sys.stderr)
-            df_serialized = serialize_for_text_format(df)
-            df_serialized.to_parquet(parquet_path, index=False)
-
-        if raw_data:
-            with open(jsonl_path, 'w') as f:
-                for record in raw_data:
-                    f.write(json.dumps(record, default=str) + '\n')
-        else:
-            df.to_json(jsonl_path, orient='records', lines=True)
+        # JSONL is written from the raw records on a worker thread while pyarrow encodes the parquet file
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            jsonl_future = executor.submit(_save_jsonl, jsonl_path, df, raw_data)
+            _save_parquet(df, parquet_path)
+            jsonl_future.result()
 
         return {'parquet': str(parquet_path), 'jsonl': str(jsonl_path)}
 
     elif format == 'parquet':
         filepath = OUTPUT_DIR / f"{filename}.parquet"
-        try:
-            df_clean.to_parquet(filepath, index=False)
-        except Exception:
-            df_serialized = serialize_for_text_format(df)
-            df_serialized.to_parquet(filepath, index=False)
+        _save_parquet(df, filepath)
     elif format == 'jsonl':
         filepath = OUTPUT_DIR / f"{filename}.jsonl"
-        if raw_data:
-            with open(filepath, 'w') as f:
-                for record in raw_data:
-                    f.write(json.dumps(record, default=str) + '\n')
-        else:
-            df.to_json(filepath, orient='records', lines=True)
+        _save_jsonl(filepath, df, raw_data)
     elif format == 'tsv':
         filepath = OUTPUT_DIR / f"{filename}.tsv"
         df_serialized = serialize_for_text_format(df)
@@ -316,12 +583,126 @@ def save_results(df, prefix, query_terms=None, format=None, raw_data=None):
         df_serialized.to_csv(filepath, index=False)
     else:
         filepath = OUTPUT_DIR / f"{filename}.parquet"
-        df_clean.to_parquet(filepath, index=False)
+        _write_parquet(clean_for_parquet(df), filepath)
 
     return str(filepath)
 
 
-def fetch_all_with_cursor(endpoint, params, max_results=None):
+# Formats that cursor pagination can write page by page
+STREAMING_FORMATS = frozenset({'dual', 'parquet', 'jsonl'})
+# Streamed records are buffered into parquet row groups of this many rows
+STREAM_ROW_GROUP_ROWS = 50_000
+
+
+def _conform_to_schema(table, schema):
+    """
+    Align a row group's Arrow table with the stream schema fixed by the first one.
+    Missing columns become nulls; values that cannot take the column's type are
+    JSON-serialized for string columns and dropped (with a warning) otherwise.
+    """
+    names = set(table.column_names)
+    extra = names.difference(schema.names)
+    if extra:
+        print(f"Warning: Dropping columns not present in the first row group: {', '.join(sorted(extra))}",
+              file=sys.stderr)
+
+    arrays = []
+    for field in schema:
+        if field.name not in names:
+            arrays.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table[field.name]
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except pa.ArrowException:
+                if pa.types.is_string(field.type):
+                    column = pa.array([v if v is None or type(v) is str else _dumps(v)
+                                       for v in column.to_pylist()], type=pa.string())
+                else:
+                    print(f"Warning: Column '{field.name}' changed type across row groups; values dropped",
+                          file=sys.stderr)
+                    column = pa.nulls(table.num_rows, field.type)
+        arrays.append(column)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class ResultStream:
+    """
+    Write cursor-paginated results to disk as they arrive (parquet and/or JSONL), so
+    memory holds at most STREAM_ROW_GROUP_ROWS records instead of the whole result.
+    Each buffered batch becomes one parquet row group; the first fixes the schema.
+    """
+
+    def __init__(self, prefix, query_terms=None, format=None):
+        format = format or DEFAULT_FORMAT
+        filename = generate_filename(prefix, query_terms)
+        self.format = format
+        self.parquet_path = OUTPUT_DIR / f"{filename}.parquet" if format in ('dual', 'parquet') else None
+        self.jsonl_path = OUTPUT_DIR / f"{filename}.jsonl" if format in ('dual', 'jsonl') else None
+        self.rows = 0
+        self._writer = None
+        self._pending = []  # Records not yet written as a row group
+        self._jsonl = open(self.jsonl_path, 'wb', buffering=1 << 20) if self.jsonl_path else None
+
+    def write(self, records):
+        """Append one page of records."""
+        if self._jsonl is not None:
+            _write_jsonl_records(self._jsonl, records)
+        if self.parquet_path is not None:
+            self._pending.extend(records)
+            if len(self._pending) >= STREAM_ROW_GROUP_ROWS:
+                self._flush()
+        self.rows += len(records)
+
+    def _flush(self):
+        """Write the buffered records to parquet as one row group."""
+        if not self._pending:
+            return
+        df = pd.DataFrame.from_records(self._pending)
+        self._pending = []
+        try:
+            table = pa.Table.from_pandas(clean_for_parquet(df), preserve_index=False, safe=False)
+        except pa.ArrowException:
+            table = pa.Table.from_pandas(serialize_for_text_format(df), preserve_index=False, safe=False)
+        if self._writer is None:
+            # Columns that are all null in the first row group are stored as strings
+            schema = pa.schema([pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                                for f in table.schema], metadata=table.schema.metadata)
+            self._writer = pq.ParquetWriter(self.parquet_path, schema, **PARQUET_WRITE_OPTIONS)
+        self._writer.write_table(_conform_to_schema(table, self._writer.schema))
+
+    def _close_files(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def close(self):
+        """Finish the files and return the path(s) like save_results."""
+        self._flush()
+        self._close_files()
+        saved = {}
+        if self.parquet_path is not None and self.parquet_path.exists():
+            saved['parquet'] = str(self.parquet_path)
+        if self.jsonl_path is not None:
+            saved['jsonl'] = str(self.jsonl_path)
+        if self.format == 'dual':
+            return saved
+        return next(iter(saved.values()), None)
+
+    def discard(self):
+        """Close and remove the files (nothing was written)."""
+        self._pending = []
+        self._close_files()
+        for path in (self.parquet_path, self.jsonl_path):
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+
+def fetch_all_with_cursor(endpoint, params, max_results=None, on_page=None):
     """
     Fetch all results using cursor pagination.
 
@@ -329,21 +710,26 @@ def fetch_all_with_cursor(endpoint, params, max_results=None):
         endpoint: API endpoint (e.g., 'works')
         params: Query parameters
         max_results: Maximum total results to retrieve (None for all)
+        on_page: Optional callback given each page's records; when set, pages are
+            handed off instead of kept, and 'data' holds only the first page
 
     Returns:
         dict with 'total', 'retrieved', 'data' (list)
     """
     all_results = []
-    params = params.copy()
-    params['cursor'] = '*'
-    params['per_page'] = 200
+    retrieved = 0
+    # Only the cursor changes between pages, so encode the rest of the query once
+    static_params = {k: v for k, v in params.items() if k != 'cursor'}
+    static_params['per_page'] = 200
+    page_endpoint = f"{endpoint}?{urlencode(static_params)}"
+    cursor = '*'
 
     total_count = None
     print(f"Fetching from {endpoint}...", file=sys.stderr)
 
     while True:
         try:
-            response = api_request(endpoint, params)
+            response = api_request(page_endpoint, {'cursor': cursor})
             results = response.get('results', [])
             meta = response.get('meta', {})
 
@@ -356,22 +742,89 @@ def fetch_all_with_cursor(endpoint, params, max_results=None):
             if not results:
                 break
 
-            all_results.extend(results)
-            print(f"Retrieved {len(all_results)} / {total_count}...", file=sys.stderr)
+            if on_page is None:
+                all_results.extend(results)
+            else:
+                on_page(results)
+                if not all_results:
+                    all_results = results
+            retrieved += len(results)
+            print(f"Retrieved {retrieved} / {total_count}...", file=sys.stderr)
 
-            if len(all_results) >= total_count:
+            if retrieved >= total_count:
                 break
 
             next_cursor = meta.get('next_cursor')
             if not next_cursor:
                 break
 
-            params['cursor'] = next_cursor
+            cursor = next_cursor
 
         except Exception as e:
             print(f"Error during pagination: {e}", file=sys.stderr)
             break
 
+    return {
+        'total': total_count,
+        'retrieved': retrieved,
+        'data': all_results
+    }
+
+
+# OpenAlex only serves page-number pagination for the first 10,000 results
+PAGE_PAGINATION_LIMIT = 10000
+PARALLEL_PAGE_WORKERS = 8
+
+
+def fetch_all_parallel(endpoint, params, max_results=None):
+    """
+    Fetch up to max_results using concurrent page-number pagination.
+
+    Pages are independent, so they are fetched on a thread pool (bounded by
+    the shared rate limiter). Falls back to cursor pagination when
+    max_results is unset or beyond the API's page-pagination limit.
+
+    Returns:
+        dict with 'total', 'retrieved', 'data' (list)
+    """
+    if not max_results or max_results > PAGE_PAGINATION_LIMIT:
+        return fetch_all_with_cursor(endpoint, params, max_results)
+
+    per_page = 200
+    print(f"Fetching from {endpoint}...", file=sys.stderr)
+
+    def fetch_page(page):
+        return api_request(endpoint, {**params, 'page': page, 'per_page': per_page})
+
+    try:
+        first = fetch_page(1)
+    except Exception as e:
+        print(f"Error during pagination: {e}", file=sys.stderr)
+        return {'total': None, 'retrieved': 0, 'data': []}
+
+    available = first.get('meta', {}).get('count', 0)
+    total_count = min(available, max_results)
+    print(f"Total available: {available}, retrieving: {total_count}", file=sys.stderr)
+
+    pages = [first.get('results', [])]
+    n_pages = -(-total_count // per_page)
+    if n_pages > 1:
+        with ThreadPoolExecutor(max_workers=PARALLEL_PAGE_WORKERS) as executor:
+            futures = [executor.submit(fetch_page, page) for page in range(2, n_pages + 1)]
+            # Keep pages in order and stop at the first failure so the
+            # results stay a contiguous prefix, as with the cursor loop.
+            for future in futures:
+                try:
+                    pages.append(future.result().get('results', []))
+                except Exception as e:
+                    print(f"Error during pagination: {e}", file=sys.stderr)
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    all_results = [record for page in pages for record in page][:total_count]
+    print(f"Retrieved {len(all_results)} / {total_count}", file=sys.stderr)
+
     return {
         'total': total_count,
         'retrieved': len(all_results),
@@ -379,12 +832,17 @@ def fetch_all_with_cursor(endpoint, params, max_results=None):
     }
 
 
-def search_works(query=None, filters=None, search_field=None, limit=25, page=1,
-                 sort=None, select=None, max_results=None, save=True):
-    """Search works with optional filters."""
+def _search(entity_type, query=None, filters=None, search_field=None, limit=25, page=1,
+            sort=None, select=None, max_results=None, save=True):
+    """
+    Search an entity endpoint with optional filters.
+
+    With search_field the query becomes a `<field>.search` filter; without
+    it, the query uses the endpoint's full-text `search` parameter.
+    """
     # Validate select fields before making API call
     if select:
-        validate_select_fields('works', select)
+        validate_select_fields(entity_type, select)
 
     params = {}
 
@@ -407,23 +865,36 @@ def search_works(query=None, filters=None, search_field=None, limit=25, page=1,
     if select:
         params['select'] = select
 
-    # Use cursor pagination for large results
+    # Fetch every page for large results
     if max_results and max_results > 200:
-        result = fetch_all_with_cursor('works', params, max_results)
-        df = pd.DataFrame(result['data'])
-
         saved_path = None
-        if save and not df.empty:
-            saved_path = save_results(df, 'works', query, raw_data=result['data'])
-            if isinstance(saved_path, dict):
-                print(f"Saved to: {saved_path['parquet']} (parquet)", file=sys.stderr)
-                print(f"          {saved_path['jsonl']} (jsonl)", file=sys.stderr)
+        if save and max_results > PAGE_PAGINATION_LIMIT and DEFAULT_FORMAT in STREAMING_FORMATS:
+            # Too many for page pagination: stream cursor pages to disk instead of holding them
+            stream = ResultStream(entity_type, query)
+            try:
+                result = fetch_all_with_cursor(entity_type, params, max_results, on_page=stream.write)
+            except BaseException:
+                stream.discard()
+                raise
+            if stream.rows:
+                saved_path = stream.close()
+            else:
+                stream.discard()
+        else:
+            result = fetch_all_parallel(entity_type, params, max_results)
+            if save and result['data']:
+                df = pd.DataFrame(result['data'])
+                saved_path = save_results(df, entity_type, query, raw_data=result['data'])
+
+        if isinstance(saved_path, dict):
+            print(f"Saved to: {saved_path['parquet']} (parquet)", file=sys.stderr)
+            print(f"          {saved_path['jsonl']} (jsonl)", file=sys.stderr)
 
         return {
             'total': result['total'],
             'returned': result['retrieved'],
             'saved_to': saved_path,
-            'works': result['data'][:20],  # Return first 20 for display
+            entity_type: result['data'][:20],  # Return first 20 for display
             'query_params': params
         }
 
@@ -431,301 +902,58 @@ def search_works(query=None, filters=None, search_field=None, limit=25, page=1,
     params['page'] = page
     params['per_page'] = min(limit, 200)
 
-    response = api_request('works', params)
-    works = response.get('results', [])
+    response = api_request(entity_type, params)
+    results = response.get('results', [])
     meta = response.get('meta', {})
 
     saved_path = None
-    if save and works:
-        df = pd.DataFrame(works)
-        saved_path = save_results(df, 'works', query, raw_data=works)
+    if save and results:
+        df = pd.DataFrame(results)
+        saved_path = save_results(df, entity_type, query, raw_data=results)
 
     return {
         'total': meta.get('count', 0),
-        'returned': len(works),
+        'returned': len(results),
         'saved_to': saved_path,
-        'works': works,
+        entity_type: results,
         'query_params': params
     }
 
 
+def search_works(query=None, filters=None, search_field=None, limit=25, page=1,
+                 sort=None, select=None, max_results=None, save=True):
+    """Search works with optional filters."""
+    return _search('works', query, filters, search_field, limit, page, sort, select, max_results, save)
+
+
 def search_authors(query=None, filters=None, limit=25, page=1, sort=None,
                    select=None, max_results=None, save=True):
     """Search authors with optional filters."""
-    # Validate select fields before making API call
-    if select:
-        validate_select_fields('authors', select)
-
-    params = {}
-
-    if query:
-        if filters:
-            params['filter'] = f"display_name.search:{query},{filters}"
-        else:
-            params['filter'] = f"display_name.search:{query}"
-    elif filters:
-        params['filter'] = filters
-
-    if sort:
-        params['sort'] = sort
-    if select:
-        params['select'] = select
-
-    if max_results and max_results > 200:
-        result = fetch_all_with_cursor('authors', params, max_results)
-        df = pd.DataFrame(result['data'])
-
-        saved_path = None
-        if save and not df.empty:
-            saved_path = save_results(df, 'authors', query, raw_data=result['data'])
-
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': saved_path,
-            'authors': result['data'][:20],
-            'query_params': params
-        }
-
-    params['page'] = page
-    params['per_page'] = min(limit, 200)
-
-    response = api_request('authors', params)
-    authors = response.get('results', [])
-    meta = response.get('meta', {})
-
-    saved_path = None
-    if save and authors:
-        df = pd.DataFrame(authors)
-        saved_path = save_results(df, 'authors', query, raw_data=authors)
-
-    return {
-        'total': meta.get('count', 0),
-        'returned': len(authors),
-        'saved_to': saved_path,
-        'authors': authors,
-        'query_params': params
-    }
+    return _search('authors', query, filters, 'display_name', limit, page, sort, select, max_results, save)
 
 
 def search_institutions(query=None, filters=None, limit=25, page=1, sort=None,
                         select=None, max_results=None, save=True):
     """Search institutions with optional filters."""
-    # Validate select fields before making API call
-    if select:
-        validate_select_fields('institutions', select)
-
-    params = {}
-
-    if query:
-        if filters:
-            params['filter'] = f"display_name.search:{query},{filters}"
-        else:
-            params['filter'] = f"display_name.search:{query}"
-    elif filters:
-        params['filter'] = filters
-
-    if sort:
-        params['sort'] = sort
-    if select:
-        params['select'] = select
-
-    if max_results and max_results > 200:
-        result = fetch_all_with_cursor('institutions', params, max_results)
-        df = pd.DataFrame(result['data'])
-
-        saved_path = None
-        if save and not df.empty:
-            saved_path = save_results(df, 'institutions', query, raw_data=result['data'])
-
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': saved_path,
-            'institutions': result['data'][:20],
-            'query_params': params
-        }
-
-    params['page'] = page
-    params['per_page'] = min(limit, 200)
-
-    response = api_request('institutions', params)
-    institutions = response.get('results', [])
-    meta = response.get('meta', {})
-
-    saved_path = None
-    if save and institutions:
-        df = pd.DataFrame(institutions)
-        saved_path = save_results(df, 'institutions', query, raw_data=institutions)
-
-    return {
-        'total': meta.get('count', 0),
-        'returned': len(institutions),
-        'saved_to': saved_path,
-        'institutions': institutions,
-        'query_params': params
-    }
+    return _search('institutions', query, filters, 'display_name', limit, page, sort, select, max_results, save)
 
 
 def search_sources(query=None, filters=None, limit=25, page=1, sort=None,
                    select=None, max_results=None, save=True):
     """Search sources (journals, repositories) with optional filters."""
-    # Validate select fields before making API call
-    if select:
-        validate_select_fields('sources', select)
-
-    params = {}
-
-    if query:
-        if filters:
-            params['filter'] = f"display_name.search:{query},{filters}"
-        else:
-            params['filter'] = f"display_name.search:{query}"
-    elif filters:
-        params['filter'] = filters
-
-    if sort:
-        params['sort'] = sort
-    if select:
-        params['select'] = select
-
-    if max_results and max_results > 200:
-        result = fetch_all_with_cursor('sources', params, max_results)
-        df = pd.DataFrame(result['data'])
-
-        saved_path = None
-        if save and not df.empty:
-            saved_path = save_results(df, 'sources', query, raw_data=result['data'])
-
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': saved_path,
-            'sources': result['data'][:20],
-            'query_params': params
-        }
-
-    params['page'] = page
-    params['per_page'] = min(limit, 200)
-
-    response = api_request('sources', params)
-    sources = response.get('results', [])
-    meta = response.get('meta', {})
-
-    saved_path = None
-    if save and sources:
-        df = pd.DataFrame(sources)
-        saved_path = save_results(df, 'sources', query, raw_data=sources)
-
-    return {
-        'total': meta.get('count', 0),
-        'returned': len(sources),
-        'saved_to': saved_path,
-        'sources': sources,
-        'query_params': params
-    }
+    return _search('sources', query, filters, 'display_name', limit, page, sort, select, max_results, save)
 
 
 def search_funders(query=None, filters=None, limit=25, page=1, sort=None,
                    select=None, max_results=None, save=True):
     """Search funders with optional filters."""
-    # Validate select fields before making API call
-    if select:
-        validate_select_fields('funders', select)
-
-    params = {}
-
-    if query:
-        if filters:
-            params['filter'] = f"display_name.search:{query},{filters}"
-        else:
-            params['filter'] = f"display_name.search:{query}"
-    elif filters:
-        params['filter'] = filters
-
-    if sort:
-        params['sort'] = sort
-    if select:
-        params['select'] = select
-
-    if max_results and max_results > 200:
-        result = fetch_all_with_cursor('funders', params, max_results)
-        df = pd.DataFrame(result['data'])
-
-        saved_path = None
-        if save and not df.empty:
-            saved_path = save_results(df, 'funders', query, raw_data=result['data'])
-
-        return {
-            'total': result['total'],
-            'returned': result['retrieved'],
-            'saved_to': saved_path,
-            'funders': result['data'][:20],
-            'query_params': params
-        }
-
-    params['page'] = page
-    params['per_page'] = min(limit, 200)
-
-    response = api_request('funders', params)
-    funders = response.get('results', [])
-    meta = response.get('meta', {})
-
-    saved_path = None
-    if save and funders:
-        df = pd.DataFrame(funders)
-        saved_path = save_results(df, 'funders', query, raw_data=funders)
-
-    return {
-        'total': meta.get('count', 0),
-        'returned': len(funders),
-        'saved_to': saved_path,
-        'funders': funders,
-        'query_params': params
-    }
+    return _search('funders', query, filters, 'display_name', limit, page, sort, select, max_results, save)
 
 
 def search_topics(query=None, filters=None, limit=25, page=1, sort=None,
                   select=None, save=True):
     """Search topics with optional filters."""
-    # Validate select fields before making API call
-    if select:
-        validate_select_fields('topics', select)
-
-    params = {}
-
-    if query:
-        if filters:
-            params['filter'] = f"display_name.search:{query},{filters}"
-        else:
-            params['filter'] = f"display_name.search:{query}"
-    elif filters:
-        params['filter'] = filters
-
-    if sort:
-        params['sort'] = sort
-    if select:
-        params['select'] = select
-
-    params['page'] = page
-    params['per_page'] = min(limit, 200)
-
-    response = api_request('topics', params)
-    topics = response.get('results', [])
-    meta = response.get('meta', {})
-
-    saved_path = None
-    if save and topics:
-        df = pd.DataFrame(topics)
-        saved_path = save_results(df, 'topics', query, raw_data=topics)
-
-    return {
-        'total': meta.get('count', 0),
-        'returned': len(topics),
-        'saved_to': saved_path,
-        'topics': topics,
-        'query_params': params
-    }
+    return _search('topics', query, filters, 'display_name', limit, page, sort, select, None, save)
 
 
 def get_entity(entity_type, entity_id):
@@ -775,25 +1003,50 @@ def autocomplete(entity_type, query, filters=None):
     }
 
 
-def main():
-    # Common arguments
-    common_parser = argparse.ArgumentParser(add_help=False)
-    common_parser.add_argument('--no-save', action='store_true', help='Do not save results')
-    common_parser.add_argument('--format', choices=['dual', 'parquet', 'jsonl', 'tsv', 'csv'],
-                               default='dual', help='Output format')
-    common_parser.add_argument('--output-dir', '-o', type=str, help='Output directory')
-    common_parser.add_argument('--email', type=str, help='Email for polite pool')
-
-    parser = argparse.ArgumentParser(description='OpenAlex API Helper',
-                                     parents=[common_parser])
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+@functools.cache
+def _terminal_width():
+    """Help text width, measured once per process (argparse re-measures for every formatter)."""
+    return shutil.get_terminal_size().columns - 2
+
+
+class _HelpFormatter(argparse.HelpFormatter):
+    """HelpFormatter that reuses the cached terminal width instead of querying the terminal."""
+
+    def __init__(self, prog, *args, **kwargs):
+        kwargs.setdefault('width', _terminal_width())
+        super().__init__(prog, *args, **kwargs)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """
+    ArgumentParser using _HelpFormatter by default. argparse builds a fresh formatter
+    for every add_argument call, so the terminal query dominated parser setup.
+    Colour is off by default for the same reason: on Python 3.14+ each formatter
+    otherwise re-checks NO_COLOR/FORCE_COLOR/TERM and isatty().
+    Subparsers inherit this class through add_subparsers.
+    """
+
+    def __init__(self, *args, formatter_class=_HelpFormatter, **kwargs):
+        if sys.version_info >= (3, 14):
+            kwargs.setdefault('color', False)
+        super().__init__(*args, formatter_class=formatter_class, **kwargs)
+
+
+def _add_common_arguments(parser):
+    """Arguments shared by all subcommands."""
+    parser.add_argument('--no-save', action='store_true', help='Do not save results')
+    parser.add_argument('--format', choices=FORMAT_CHOICES,
+                        default='dual', help='Output format')
+    parser.add_argument('--output-dir', '-o', type=str, help='Output directory')
+    parser.add_argument('--email', type=str, help='Email for polite pool')
+    parser.add_argument('--refresh-field-cache', action='store_true',
+                        help='Re-fetch valid group_by/select fields instead of using the on-disk cache')
+
 
-    # Search works
-    works_parser = subparsers.add_parser('search-works', help='Search works',
-                                         parents=[common_parser])
+def _add_works_arguments(works_parser):
     works_parser.add_argument('query', nargs='?', help='Search query')
     works_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
-    works_parser.add_argument('--search-field', choices=['title', 'abstract', 'fulltext', 'title_and_abstract'],
+    works_parser.add_argument('--search-field', choices=SEARCH_FIELD_CHOICES,
                               help='Specific field to search')
     works_parser.add_argument('--sort', '-s', help='Sort field')
     works_parser.add_argument('--select', help='Fields to select')
@@ -801,130 +1054,217 @@ def main():
     works_parser.add_argument('--page', '-p', type=int, default=1, help='Page number')
     works_parser.add_argument('--max-results', '-m', type=int, help='Max results (enables cursor pagination)')
 
-    # Search authors
-    authors_parser = subparsers.add_parser('search-authors', help='Search authors',
-                                           parents=[common_parser])
-    authors_parser.add_argument('query', nargs='?', help='Search query (author name)')
-    authors_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
-    authors_parser.add_argument('--sort', '-s', help='Sort field')
-    authors_parser.add_argument('--select', help='Fields to select')
-    authors_parser.add_argument('--limit', '-l', type=int, default=25)
-    authors_parser.add_argument('--page', '-p', type=int, default=1)
-    authors_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search institutions
-    inst_parser = subparsers.add_parser('search-institutions', help='Search institutions',
-                                        parents=[common_parser])
-    inst_parser.add_argument('query', nargs='?', help='Search query (institution name)')
-    inst_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
-    inst_parser.add_argument('--sort', '-s', help='Sort field')
-    inst_parser.add_argument('--select', help='Fields to select')
-    inst_parser.add_argument('--limit', '-l', type=int, default=25)
-    inst_parser.add_argument('--page', '-p', type=int, default=1)
-    inst_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search sources
-    sources_parser = subparsers.add_parser('search-sources', help='Search sources (journals)',
-                                           parents=[common_parser])
-    sources_parser.add_argument('query', nargs='?', help='Search query (source name)')
-    sources_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
-    sources_parser.add_argument('--sort', '-s', help='Sort field')
-    sources_parser.add_argument('--select', help='Fields to select')
-    sources_parser.add_argument('--limit', '-l', type=int, default=25)
-    sources_parser.add_argument('--page', '-p', type=int, default=1)
-    sources_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search funders
-    funders_parser = subparsers.add_parser('search-funders', help='Search funders',
-                                           parents=[common_parser])
-    funders_parser.add_argument('query', nargs='?', help='Search query (funder name)')
-    funders_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
-    funders_parser.add_argument('--sort', '-s', help='Sort field')
-    funders_parser.add_argument('--select', help='Fields to select')
-    funders_parser.add_argument('--limit', '-l', type=int, default=25)
-    funders_parser.add_argument('--page', '-p', type=int, default=1)
-    funders_parser.add_argument('--max-results', '-m', type=int)
-
-    # Search topics
-    topics_parser = subparsers.add_parser('search-topics', help='Search topics',
-                                          parents=[common_parser])
+
+def _add_entity_search_arguments(search_parser, query_help):
+    """Search authors, institutions, sources or funders (same arguments for each)."""
+    search_parser.add_argument('query', nargs='?', help=query_help)
+    search_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
+    search_parser.add_argument('--sort', '-s', help='Sort field')
+    search_parser.add_argument('--select', help='Fields to select')
+    search_parser.add_argument('--limit', '-l', type=int, default=25)
+    search_parser.add_argument('--page', '-p', type=int, default=1)
+    search_parser.add_argument('--max-results', '-m', type=int)
+
+
+def _add_topics_arguments(topics_parser):
     topics_parser.add_argument('query', nargs='?', help='Search query')
     topics_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
     topics_parser.add_argument('--sort', '-s', help='Sort field')
     topics_parser.add_argument('--limit', '-l', type=int, default=25)
 
-    # Get single entity
-    get_parser = subparsers.add_parser('get', help='Get a single entity by ID',
-                                       parents=[common_parser])
-    get_parser.add_argument('entity_type', choices=['works', 'authors', 'institutions', 'sources', 'funders', 'topics'])
+
+def _add_get_arguments(get_parser):
+    get_parser.add_argument('entity_type', choices=ENTITY_CHOICES)
     get_parser.add_argument('entity_id', help='Entity ID (OpenAlex ID, DOI, ORCID, ROR, etc.)')
 
-    # Group by
-    group_parser = subparsers.add_parser('group', help='Group entities by field',
-                                         parents=[common_parser])
-    group_parser.add_argument('entity_type', choices=['works', 'authors', 'institutions', 'sources', 'funders'])
+
+def _add_group_arguments(group_parser):
+    group_parser.add_argument('entity_type', choices=ENTITY_CHOICES_NO_TOPICS)
     group_parser.add_argument('group_field', help='Field to group by')
     group_parser.add_argument('--filter', '-f', dest='filters', help='Filter expression')
 
-    # Autocomplete
-    auto_parser = subparsers.add_parser('autocomplete', help='Autocomplete search',
-                                        parents=[common_parser])
-    auto_parser.add_argument('entity_type', choices=['works', 'authors', 'institutions', 'sources', 'funders'])
+
+def _add_batch_arguments(batch_parser):
+    batch_parser.add_argument('input', nargs='?', default='-',
+                              help='JSON file with a list of commands, e.g. [["get", "works", "W1"]] (default: stdin)')
+
+
+def _add_autocomplete_arguments(auto_parser):
+    auto_parser.add_argument('entity_type', choices=ENTITY_CHOICES_NO_TOPICS)
     auto_parser.add_argument('query', help='Autocomplete query')
 
-    args = parser.parse_args()
 
-    # Set global config
-    global OUTPUT_DIR, EMAIL
+# Subcommand name -> (help text, function adding its arguments), in --help listing order
+COMMAND_PARSERS = {
+    'search-works': ('Search works', _add_works_arguments),
+    'search-authors': ('Search authors',
+                       functools.partial(_add_entity_search_arguments, query_help='Search query (author name)')),
+    'search-institutions': ('Search institutions',
+                            functools.partial(_add_entity_search_arguments,
+                                              query_help='Search query (institution name)')),
+    'search-sources': ('Search sources (journals)',
+                       functools.partial(_add_entity_search_arguments, query_help='Search query (source name)')),
+    'search-funders': ('Search funders',
+                       functools.partial(_add_entity_search_arguments, query_help='Search query (funder name)')),
+    'search-topics': ('Search topics', _add_topics_arguments),
+    'get': ('Get a single entity by ID', _add_get_arguments),
+    'group': ('Group entities by field', _add_group_arguments),
+    'autocomplete': ('Autocomplete search', _add_autocomplete_arguments),
+    'batch': ('Run a JSON list of commands in one process', _add_batch_arguments),
+}
+
+
+def _sniff_subcommand(argv):
+    """Return the first argument naming a known subcommand, or None."""
+    return next((arg for arg in argv if not arg.startswith('-') and arg in COMMAND_PARSERS), None)
+
+
+def _build_parser(command=None):
+    """
+    Build the CLI parser. Only `command` gets its arguments; every other
+    subcommand is registered by name and help text alone, so --help and usage
+    messages still list them all.
+    """
+    parser = _ArgumentParser(description='OpenAlex API Helper')
+    _add_common_arguments(parser)
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+    for name, (help_text, add_arguments) in COMMAND_PARSERS.items():
+        if name == command:
+            subparser = subparsers.add_parser(name, help=help_text)
+            _add_common_arguments(subparser)
+            add_arguments(subparser)
+        else:
+            subparsers.add_parser(name, help=help_text)
+    return parser
+
+
+def _apply_global_options(args):
+    """Apply the common options that configure module state (--output-dir, --email, --refresh-field-cache)."""
+    global OUTPUT_DIR, EMAIL, FIELD_CACHE_REFRESH
     if hasattr(args, 'output_dir') and args.output_dir:
         OUTPUT_DIR = Path(args.output_dir)
         OUTPUT_DIR.mkdir(exist_ok=True)
     if hasattr(args, 'email') and args.email:
         EMAIL = args.email
+        _SESSION.headers['User-Agent'] = f'openalex-helper (mailto:{EMAIL})'
+        if _HTTPX is not None:
+            _HTTPX.headers['User-Agent'] = _SESSION.headers['User-Agent']
+
+    if getattr(args, 'refresh_field_cache', False):
+        FIELD_CACHE_REFRESH = True
+
+
+# Search options only some search-* subcommands define (--search-field is works-only;
+# search-topics has no --page, --select or --max-results)
+_SEARCH_OPTIONS = ('search_field', 'page', 'select', 'max_results')
 
+
+def _run_search(search, args, save):
+    """Handler shared by the search-* commands; options a subcommand lacks keep the search function's defaults."""
+    options = {name: getattr(args, name) for name in _SEARCH_OPTIONS if hasattr(args, name)}
+    return search(args.query, args.filters, limit=args.limit, sort=args.sort, save=save, **options)
+
+
+# Subcommand name -> handler(args, save)
+COMMAND_HANDLERS = {
+    'search-works': functools.partial(_run_search, search_works),
+    'search-authors': functools.partial(_run_search, search_authors),
+    'search-institutions': functools.partial(_run_search, search_institutions),
+    'search-sources': functools.partial(_run_search, search_sources),
+    'search-funders': functools.partial(_run_search, search_funders),
+    'search-topics': functools.partial(_run_search, search_topics),
+    'get': lambda args, save: get_entity(args.entity_type, args.entity_id),
+    'group': lambda args, save: group_by(args.entity_type, args.group_field, args.filters, save),
+    'autocomplete': lambda args, save: autocomplete(args.entity_type, args.query),
+    'batch': lambda args, save: run_batch(_read_batch(args.input)),
+}
+
+
+def _run(args):
+    """Run a parsed subcommand and return its result."""
     save = not getattr(args, 'no_save', False)
+    return COMMAND_HANDLERS[args.command](args, save)
 
-    if args.command == 'search-works':
-        result = search_works(
-            args.query, args.filters, args.search_field, args.limit, args.page,
-            args.sort, args.select, args.max_results, save
-        )
-    elif args.command == 'search-authors':
-        result = search_authors(
-            args.query, args.filters, args.limit, args.page, args.sort,
-            args.select, args.max_results, save
-        )
-    elif args.command == 'search-institutions':
-        result = search_institutions(
-            args.query, args.filters, args.limit, args.page, args.sort,
-            args.select, args.max_results, save
-        )
-    elif args.command == 'search-sources':
-        result = search_sources(
-            args.query, args.filters, args.limit, args.page, args.sort,
-            args.select, args.max_results, save
-        )
-    elif args.command == 'search-funders':
-        result = search_funders(
-            args.query, args.filters, args.limit, args.page, args.sort,
-            args.select, args.max_results, save
-        )
-    elif args.command == 'search-topics':
-        result = search_topics(
-            args.query, args.filters, args.limit, args.page, args.sort,
-            getattr(args, 'select', None), save
-        )
-    elif args.command == 'get':
-        result = get_entity(args.entity_type, args.entity_id)
-    elif args.command == 'group':
-        result = group_by(args.entity_type, args.group_field, args.filters, save)
-    elif args.command == 'autocomplete':
-        result = autocomplete(args.entity_type, args.query)
+
+def _read_batch(source):
+    """Load a batch (a JSON list of argument lists) from a file path, or stdin for '-'."""
+    if source == '-':
+        commands = json.load(sys.stdin)
     else:
+        with open(source) as f:
+            commands = json.load(f)
+    if not isinstance(commands, list) or not all(isinstance(c, list) for c in commands):
+        raise ValueError("Batch input must be a JSON list of argument lists, e.g. [[\"get\", \"works\", \"W1\"]]")
+    return commands
+
+
+def run_batch(commands):
+    """
+    Run several commands in one process and return their results in order.
+    Each command is an argument list as it would be typed after the script name,
+    e.g. ['search-works', 'machine learning', '-l', '5']. A command that fails
+    yields {'error': ...} without stopping the rest of the batch. Options that set
+    module state (--output-dir, --email) stay in effect for later commands.
+    """
+    results = []
+    for argv in commands:
+        argv = [str(arg) for arg in argv]
+        command = _sniff_subcommand(argv)
+        try:
+            if command is None or command == 'batch':
+                raise ValueError(f"Not a runnable batch command: {argv}")
+            # Help text would go to stdout, into the middle of the JSON result list
+            if '-h' in argv or '--help' in argv:
+                raise ValueError(f"--help is not supported inside a batch: {argv}")
+            args = _build_parser(command).parse_args(argv)
+            _apply_global_options(args)
+            results.append(_run(args))
+        except SystemExit:
+            # argparse has already printed the usage error to stderr
+            results.append({'error': f"Invalid arguments: {argv}"})
+        except Exception as e:
+            results.append({'error': str(e)})
+    return results
+
+
+def _prefetch_fields(argv):
+    """
+    Start fetching the field list a command will be validated against (group_by
+    fields for `group`, select fields for a search with --select) on a daemon
+    thread, so the request overlaps parser setup. Returns the thread, or None.
+    """
+    # These options change how the fetch is made, and are only applied after parsing
+    if any(arg.startswith(('--refresh-field-cache', '--email')) for arg in argv):
+        return None
+    command = _sniff_subcommand(argv)
+    if command == 'group':
+        positional = [arg for arg in argv[argv.index(command) + 1:] if not arg.startswith('-')]
+        if not positional or positional[0] not in ENTITY_CHOICES_NO_TOPICS:
+            return None
+        fetch = functools.partial(_fetch_valid_group_by_fields, positional[0])
+    elif command and command.startswith('search-') and any(arg.startswith('--select') for arg in argv):
+        fetch = functools.partial(_fetch_valid_select_fields, command.removeprefix('search-'))
+    else:
+        return None
+    thread = threading.Thread(target=fetch, daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    prefetch = _prefetch_fields(sys.argv[1:])
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
+    args = parser.parse_args()
+    _apply_global_options(args)
+    if prefetch is not None:
+        # Validation reads the fetched fields from the cache; don't race the thread to fetch them again
+        prefetch.join()
+
+    if args.command is None:
         parser.print_help()
         return
 
-    print(json.dumps(result, indent=2, default=str))
+    _print_result(_run(args))
 
 
 if __name__ == '__main__':
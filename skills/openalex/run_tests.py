@@ -7,8 +7,11 @@ Usage:
     python run_tests.py -v           # Verbose output
     python run_tests.py -k validation # Run only validation tests
     python run_tests.py --quick      # Run only unit tests (no API calls)
+
+Integration tests run in parallel (-n auto) when pytest-xdist is installed.
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -23,10 +26,15 @@ def run_tests():
     args = sys.argv[1:]
 
     # Check for --quick flag
-    if '--quick' in args:
+    quick = '--quick' in args
+    if quick:
         args.remove('--quick')
         args.extend(['-k', 'not integration'])
 
+    # API-bound integration tests are independent: spread them over workers if xdist is available
+    if not quick and '-n' not in args and importlib.util.find_spec('xdist') is not None:
+        args.extend(['-n', 'auto'])
+
     # Default to verbose if not specified
     if '-v' not in args and '--verbose' not in args:
         args.append('-v')
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the OpenAlex skill tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'e2e: run the command through the installed script in a fresh interpreter')
+
+
+def pytest_addoption(parser):
+    parser.addoption('--subprocess', action='store_true', default=False,
+                     help='Run integration commands in a fresh interpreter (smoke test of the installed script)')
+
+
+@pytest.fixture(scope='session')
+def helper():
+    """The openalex_helper module, imported once for the whole session."""
+    import openalex_helper
+    return openalex_helper
@@ -4,9 +4,13 @@ Integration tests for OpenAlex skill.
 These tests run actual commands and verify behavior.
 """
 
+import copy
+import io
 import subprocess
 import json
 import os
+import sys
+import traceback
 import pytest
 
 # Path to the helper script
@@ -14,10 +18,27 @@ HELPER_SCRIPT = os.path.expanduser('~/.claude/skills/openalex/openalex_helper.py
 CONDA_CMD = ['/opt/anaconda3/bin/conda', 'run', '-n', 'base', 'python', HELPER_SCRIPT]
 
 
-def run_command(args, expect_failure=False):
-    """Run a command and return the result."""
+# Read-only commands whose output can be shared between tests with the same arguments
+# (search and group commands save files, so they always run)
+IDEMPOTENT_COMMANDS = frozenset({'get', 'autocomplete'})
+
+# Parsed results of idempotent commands, keyed by (subprocess?, arguments)
+_RESULT_CACHE = {}
+
+# TestBasicSearch commands, run together as one batch (test key -> arguments)
+BASIC_SEARCH_COMMANDS = {
+    'works': ['search-works', 'machine learning', '-l', '5'],
+    'authors': ['search-authors', 'Einstein', '-l', '5'],
+    'institutions': ['search-institutions', 'Stanford', '-l', '5'],
+    'funders': ['search-funders', 'NSF', '-l', '5'],
+}
+
+
+def run_command_subprocess(args, expect_failure=False, input=None):
+    """Run a command in a fresh interpreter and return the result."""
     result = subprocess.run(
         CONDA_CMD + args,
+        input=input,
         capture_output=True,
         text=True,
         timeout=120
@@ -30,54 +51,130 @@ def run_command(args, expect_failure=False):
         return json.loads(result.stdout)
 
 
+def _memoize_idempotent(run, subprocess_mode):
+    """Wrap a runner so each read-only command is run, and its output parsed, once per session."""
+    def cached_run(args, expect_failure=False, input=None):
+        if expect_failure or input is not None or not args or args[0] not in IDEMPOTENT_COMMANDS:
+            return run(args, expect_failure, input=input)
+        key = (subprocess_mode, tuple(args))
+        if key not in _RESULT_CACHE:
+            _RESULT_CACHE[key] = run(args)
+        # Tests may modify what they get back; hand each one its own copy
+        return copy.deepcopy(_RESULT_CACHE[key])
+
+    return cached_run
+
+
+@pytest.fixture
+def run_command(request, helper, monkeypatch, capsys):
+    """
+    Run a command and return the result.
+    Commands run in-process through helper.main() so the import is paid once per
+    session; tests marked e2e (or every test, with --subprocess) run the installed script
+    in a fresh interpreter instead.
+    """
+    if request.config.getoption('--subprocess') or request.node.get_closest_marker('e2e'):
+        return _memoize_idempotent(run_command_subprocess, subprocess_mode=True)
+    # main() assigns these from the command line; restore them after each test
+    for name in ('OUTPUT_DIR', 'EMAIL', 'FIELD_CACHE_REFRESH'):
+        monkeypatch.setattr(helper, name, getattr(helper, name))
+
+    def run(args, expect_failure=False, input=None):
+        monkeypatch.setattr(sys, 'argv', ['openalex_helper.py'] + args)
+        if input is not None:
+            monkeypatch.setattr(sys, 'stdin', io.StringIO(input))
+        error = ''
+        try:
+            helper.main()
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            # An uncaught exception is what a subprocess would report on stderr
+            error = traceback.format_exc()
+            returncode = 1
+        captured = capsys.readouterr()
+        if expect_failure:
+            assert returncode != 0, f"Expected failure but got success: {captured.out}"
+            return captured.err + error
+        assert returncode == 0, f"Command failed: {captured.err}{error}"
+        return json.loads(captured.out)
+
+    return _memoize_idempotent(run, subprocess_mode=False)
+
+
+@pytest.fixture(scope='session')
+def basic_search_results(request, helper):
+    """
+    Run every BASIC_SEARCH_COMMANDS entry once through the batch command and
+    return {test key: result}; with --subprocess the batch is a single subprocess.
+    """
+    commands = list(BASIC_SEARCH_COMMANDS.values())
+    if request.config.getoption('--subprocess'):
+        results = run_command_subprocess(['batch'], input=json.dumps(commands))
+    else:
+        results = helper.run_batch(commands)
+    return dict(zip(BASIC_SEARCH_COMMANDS, results))
+
+
 class TestBasicSearch:
     """Tests for basic search functionality."""
 
-    def test_search_works_basic(self):
+    def test_search_works_basic(self, basic_search_results):
         """Basic search should return results."""
-        data = run_command(['search-works', 'machine learning', '-l', '5'])
+        data = basic_search_results['works']
         assert 'works' in data
         assert len(data['works']) <= 5
         assert data['total'] > 0
 
-    def test_search_authors_basic(self):
+    def test_search_authors_basic(self, basic_search_results):
         """Author search should return results."""
-        data = run_command(['search-authors', 'Einstein', '-l', '5'])
+        data = basic_search_results['authors']
         assert 'authors' in data
 
-    def test_search_institutions_basic(self):
+    def test_search_institutions_basic(self, basic_search_results):
         """Institution search should return results."""
-        data = run_command(['search-institutions', 'Stanford', '-l', '5'])
+        data = basic_search_results['institutions']
         assert 'institutions' in data
 
-    def test_search_funders_basic(self):
+    def test_search_funders_basic(self, basic_search_results):
         """Funder search should return results."""
-        data = run_command(['search-funders', 'NSF', '-l', '5'])
+        data = basic_search_results['funders']
         assert 'funders' in data
 
+    def test_batch_reports_failed_command(self, run_command):
+        """A failing command in a batch should yield an error entry, not abort the batch."""
+        commands = [['group', 'works', 'fake_field_xyz'], ['get', 'works', '--help'],
+                    ['get', 'works', 'W2741809807']]
+        data = run_command(['batch'], input=json.dumps(commands))
+        assert len(data) == 3
+        assert 'Invalid' in data[0]['error']
+        assert '--help' in data[1]['error']
+        assert 'id' in data[2]
+
 
 class TestGroupBy:
     """Tests for group_by functionality."""
 
-    def test_group_by_valid_field(self):
+    def test_group_by_valid_field(self, run_command):
         """Group by valid field should succeed."""
         data = run_command(['group', 'works', 'publication_year',
                           '-f', 'publication_year:>2020'])
         assert 'groups' in data
         assert len(data['groups']) > 0
 
-    def test_group_by_oa_status(self):
+    def test_group_by_oa_status(self, run_command):
         """Group by oa_status should work."""
         data = run_command(['group', 'works', 'oa_status',
                           '-f', 'publication_year:2023'])
         assert 'groups' in data
 
-    def test_group_by_invalid_field_fails(self):
+    def test_group_by_invalid_field_fails(self, run_command):
         """Group by invalid field should fail with helpful error."""
         stderr = run_command(['group', 'works', 'grants.funder'], expect_failure=True)
         assert 'Invalid group_by field' in stderr
 
-    def test_group_by_nonexistent_field_fails(self):
+    def test_group_by_nonexistent_field_fails(self, run_command):
         """Group by nonexistent field should fail."""
         stderr = run_command(['group', 'works', 'fake_field_xyz'], expect_failure=True)
         assert 'Invalid' in stderr
@@ -86,13 +183,13 @@ class TestGroupBy:
 class TestSelectValidation:
     """Tests for select parameter validation."""
 
-    def test_valid_select_succeeds(self):
+    def test_valid_select_succeeds(self, run_command):
         """Valid select fields should work."""
         data = run_command(['search-works', 'AI', '-l', '1',
                           '--select', 'id,title,publication_year'])
         assert 'works' in data
 
-    def test_invalid_select_grants_fails(self):
+    def test_invalid_select_grants_fails(self, run_command):
         """Selecting grants should fail."""
         stderr = run_command(['search-works', 'AI', '-l', '1',
                             '--select', 'id,grants'], expect_failure=True)
@@ -102,13 +199,22 @@ class TestSelectValidation:
 class TestGetEntity:
     """Tests for getting single entities."""
 
-    def test_get_work_by_id(self):
+    @pytest.mark.e2e
+    def test_get_work_by_id(self, run_command):
         """Get work by OpenAlex ID should work."""
         data = run_command(['get', 'works', 'W2741809807'])
         assert 'id' in data
         assert 'title' in data
 
-    def test_get_funder_by_id(self):
+    def test_get_work_repeat_returns_fresh_copy(self, run_command):
+        """A repeated read-only command should return an equal but independent result."""
+        first = run_command(['get', 'works', 'W2741809807'])
+        first['title'] = None
+        second = run_command(['get', 'works', 'W2741809807'])
+        assert second['title'] is not None
+        assert second['id'] == first['id']
+
+    def test_get_funder_by_id(self, run_command):
         """Get funder by ID should work."""
         data = run_command(['get', 'funders', 'F4320306076'])  # NSF
         assert 'id' in data
@@ -118,7 +224,7 @@ class TestGetEntity:
 class TestOutputFormats:
     """Tests for output file generation."""
 
-    def test_dual_format_creates_both_files(self):
+    def test_dual_format_creates_both_files(self, run_command):
         """Dual format should create both parquet and jsonl."""
         data = run_command(['search-works', 'test query xyz', '-l', '5'])
         if data.get('saved_to'):
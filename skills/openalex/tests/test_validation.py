@@ -92,9 +92,9 @@ class TestFieldFetching:
     """Tests for dynamic field fetching from API."""
 
     def test_fetch_group_by_fields_returns_set(self):
-        """_fetch_valid_group_by_fields should return a set."""
+        """_fetch_valid_group_by_fields should return a (frozen) set."""
         fields = _fetch_valid_group_by_fields('works')
-        assert isinstance(fields, set)
+        assert isinstance(fields, (set, frozenset))
 
     def test_fetch_group_by_fields_contains_publication_year(self):
         """Fetched fields should contain publication_year."""
@@ -102,9 +102,9 @@ class TestFieldFetching:
         assert 'publication_year' in fields
 
     def test_fetch_select_fields_returns_set(self):
-        """_fetch_valid_select_fields should return a set."""
+        """_fetch_valid_select_fields should return a (frozen) set."""
         fields = _fetch_valid_select_fields('works')
-        assert isinstance(fields, set)
+        assert isinstance(fields, (set, frozenset))
 
     def test_fetch_select_fields_contains_id(self):
         """Fetched select fields should contain id."""